@@ -2,11 +2,74 @@ import sys
 import os
 import subprocess
 import json
+import configparser
+from pathlib import Path
+import threading
+import bisect
 from PySide6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
                               QHBoxLayout, QComboBox, QPushButton, QLabel, 
                               QFileDialog, QCheckBox, QMessageBox, QGroupBox,
                               QLineEdit)
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QObject, QRunnable, QThreadPool, Signal
+
+# VBS字符串中的反斜杠转义表
+_BS_TABLE = str.maketrans({'\\': '\\\\'})
+
+# VBS脚本模板
+_VBS_HEADER = (
+    'Set WshShell = CreateObject("WScript.Shell")\n'
+    'Set fso = CreateObject("Scripting.FileSystemObject")\n\n'
+    "' 获取脚本所在目录\n"
+    'strPath = fso.GetParentFolderName(WScript.ScriptFullName)\n\n'
+)
+
+# 隐藏窗口模式 - 使用pythonw.exe
+_VBS_HIDE_TMPL = _VBS_HEADER + (
+    "' 使用完整的激活命令并运行程序（隐藏窗口）\n"
+    'cmd = "cmd /c call ""{activate}"" {env} && " & _\n'
+    '      """{pythonw}"" """ & strPath & "\\{pyfile}"""\n\n'
+    "WshShell.Run cmd, 0, True\n"
+)
+
+# 显示窗口模式 - VBS调用批处理文件
+_VBS_SHOW_TMPL = _VBS_HEADER + (
+    "' 使用批处理文件运行Python脚本（显示窗口和输出）\n"
+    'batFile = strPath & "\\{batfile}"\n'
+    'WshShell.Run "cmd /c """ & batFile & """", 1, False\n'
+)
+
+# 批处理文件模板
+_BAT_TMPL = (
+    '@echo off\n'
+    'call "{activate}" {env}\n'
+    'echo 正在使用环境: {env}\n'
+    'echo 运行Python脚本: {pyfile}\n'
+    'echo.\n'
+    '"{python}" "{python_file}"\n'
+    'echo.\n'
+    'echo 脚本执行完毕，按任意键退出...\n'
+    'pause > nul\n'
+)
+
+class EnvProbeSignals(QObject):
+    """环境探测任务的信号（QRunnable本身不能定义信号）"""
+    done = Signal(int, int, object)  # 加载批次, 候选序号, 环境信息(dict或None)
+
+
+class EnvProbe(QRunnable):
+    """在线程池中探测单个环境"""
+    
+    def __init__(self, generation, index, candidate, probe_func):
+        super().__init__()
+        self.generation = generation
+        self.index = index
+        self.candidate = candidate
+        self.probe_func = probe_func
+        self.signals = EnvProbeSignals()
+    
+    def run(self):
+        self.signals.done.emit(self.generation, self.index, self.probe_func(self.candidate))
+
 
 class AnacondaEnvSelector(QMainWindow):
     def __init__(self):
@@ -14,8 +77,21 @@ class AnacondaEnvSelector(QMainWindow):
         self.setWindowTitle("Anaconda环境选择器")
         self.setMinimumSize(600, 350)
         
-        # 存储环境信息
+        # 存储环境信息（按候选顺序排列，env_order为对应的候选序号）
         self.environments = []
+        self.env_order = []
+        
+        # 后台探测状态：刷新时批次号递增，丢弃旧批次的结果
+        self.probe_generation = 0
+        self.pending_probes = {}
+        
+        # Python版本缓存（解释器路径 -> "mtime|版本"），避免每次刷新都启动子进程
+        # 路径中含有冒号，只使用等号作为分隔符
+        self.config = configparser.ConfigParser(delimiters=("=",), interpolation=None)
+        self.config.optionxform = str
+        self.config_lock = threading.Lock()
+        self.config_file = os.path.join(os.path.dirname(os.path.abspath(__file__)), "anaconda_env_selector.ini")
+        self.load_settings()
         
         # 创建主窗口部件
         central_widget = QWidget()
@@ -94,6 +170,67 @@ class AnacondaEnvSelector(QMainWindow):
         # 连接环境选择变化信号
         self.env_combo.currentIndexChanged.connect(self.update_env_details)
     
+    def load_settings(self):
+        """加载配置文件（Python版本缓存）"""
+        if os.path.exists(self.config_file):
+            try:
+                self.config.read(self.config_file, encoding="utf-8")
+            except Exception as e:
+                print(f"读取配置文件出错: {str(e)}")
+        if not self.config.has_section("PythonVersionCache"):
+            self.config.add_section("PythonVersionCache")
+    
+    def save_settings(self):
+        """保存配置文件"""
+        try:
+            with open(self.config_file, "w", encoding="utf-8") as f:
+                self.config.write(f)
+        except Exception as e:
+            print(f"保存配置文件出错: {str(e)}")
+    
+    def closeEvent(self, event):
+        """关闭窗口时保存版本缓存"""
+        self.save_settings()
+        super().closeEvent(event)
+    
+    def _get_python_version(self, python_entry):
+        """获取Python版本，解释器未变化（mtime相同）时直接使用缓存
+        
+        参数:
+        - python_entry: python.exe对应的os.DirEntry，Windows下其stat信息来自目录枚举，无需额外系统调用
+        """
+        cache = self.config["PythonVersionCache"]
+        python_path = python_entry.path
+        try:
+            mtime = str(python_entry.stat().st_mtime_ns)
+        except OSError:
+            return "未知版本"
+        
+        with self.config_lock:
+            cached_entry = cache.get(python_path, "")
+        cached_mtime, _, cached_version = cached_entry.partition("|")
+        if cached_mtime == mtime and cached_version:
+            return cached_version
+        
+        try:
+            # CREATE_NO_WINDOW避免为子进程分配控制台窗口（非Windows平台为0）
+            version_result = subprocess.run(
+                [python_path, "--version"],
+                capture_output=True,
+                text=True,
+                check=True,
+                close_fds=False,
+                creationflags=getattr(subprocess, "CREATE_NO_WINDOW", 0),
+                timeout=5
+            )
+            python_version = version_result.stdout.strip()
+        except Exception:
+            return "未知版本"
+        
+        with self.config_lock:
+            cache[python_path] = f"{mtime}|{python_version}"
+        return python_version
+    
     def browse_anaconda_path(self):
         """浏览选择Anaconda安装路径"""
         dir_path = QFileDialog.getExistingDirectory(
@@ -107,7 +244,10 @@ class AnacondaEnvSelector(QMainWindow):
     def load_environments(self):
         """加载所有Anaconda环境"""
         try:
+            self.probe_generation += 1
+            self.pending_probes = {}
             self.environments = []
+            self.env_order = []
             self.env_combo.clear()
             
             # 获取用户指定的Anaconda路径
@@ -117,75 +257,95 @@ class AnacondaEnvSelector(QMainWindow):
                 QMessageBox.warning(self, "警告", f"指定的Anaconda路径不存在: {anaconda_dir}")
                 return
             
-            # 添加base环境
-            if os.path.exists(os.path.join(anaconda_dir, "python.exe")):
-                self._add_environment("base", anaconda_dir)
+            # 收集候选环境：base环境 + envs目录下的各子目录
+            # 是否包含python.exe由_probe_env扫描环境目录时判断
+            candidates = [("base", anaconda_dir)]
             
-            # 查找envs目录下的环境
             envs_dir = os.path.join(anaconda_dir, "envs")
-            if os.path.exists(envs_dir):
-                for env_name in os.listdir(envs_dir):
-                    env_path = os.path.join(envs_dir, env_name)
-                    if os.path.isdir(env_path) and os.path.exists(os.path.join(env_path, "python.exe")):
-                        self._add_environment(env_name, env_path)
+            if os.path.isdir(envs_dir):
+                # 使用scandir，目录判断直接复用枚举时返回的属性，省去逐个stat
+                with os.scandir(envs_dir) as it:
+                    for entry in it:
+                        if entry.is_dir(follow_symlinks=False):
+                            candidates.append((entry.name, entry.path))
             
-            # 如果有环境，选择第一个
-            if self.environments:
-                self.update_env_details(0)
-            else:
-                QMessageBox.warning(
-                    self, 
-                    "警告", 
-                    f"在指定的Anaconda路径下未找到环境: {anaconda_dir}\n请确认路径是否正确。"
-                )
+            # 各环境的版本探测互不相关，提交到线程池后台执行，避免阻塞界面
+            # 探测完成后在主线程中按候选顺序逐个加入列表
+            pool = QThreadPool.globalInstance()
+            for index, candidate in enumerate(candidates):
+                probe = EnvProbe(self.probe_generation, index, candidate, self._probe_env)
+                probe.signals.done.connect(self._on_env_probed)
+                # 保留引用，防止任务完成前被回收
+                self.pending_probes[index] = probe
+                pool.start(probe)
                 
         except Exception as e:
             QMessageBox.critical(self, "错误", f"加载环境列表失败: {str(e)}")
     
-    def _add_environment(self, env_name, env_path):
-        """添加环境到列表"""
+    def _on_env_probed(self, generation, index, env_info):
+        """单个环境探测完成（主线程）"""
+        if generation != self.probe_generation:
+            return
+        
+        self.pending_probes.pop(index, None)
+        if env_info:
+            self._add_environment(index, env_info)
+        
+        if self.pending_probes:
+            return
+        
+        # 全部探测完成
+        if self.environments:
+            self.update_env_details(self.env_combo.currentIndex())
+        else:
+            QMessageBox.warning(
+                self, 
+                "警告", 
+                f"在指定的Anaconda路径下未找到环境: {self.anaconda_path.text()}\n请确认路径是否正确。"
+            )
+    
+    def _probe_env(self, candidate):
+        """探测环境信息（在线程池中执行，不访问界面）"""
+        env_name, env_path = candidate
         try:
-            python_path = os.path.join(env_path, "python.exe")
-            pythonw_path = os.path.join(env_path, "pythonw.exe")
+            # 一次扫描环境目录，代替逐个exists探测
+            with os.scandir(env_path) as it:
+                files = {entry.name.lower(): entry for entry in it}
+            
+            python_entry = files.get("python.exe")
+            if python_entry is None or not python_entry.is_file():
+                return None
+            pythonw_entry = files.get("pythonw.exe")
             
             # 优先使用pythonw.exe
-            python_exe = pythonw_path if os.path.exists(pythonw_path) else python_path
+            python_exe = pythonw_entry.path if pythonw_entry is not None else python_entry.path
             
             # 获取Python版本
-            try:
-                version_result = subprocess.run(
-                    [python_path, "--version"],
-                    capture_output=True,
-                    text=True,
-                    check=True
-                )
-                python_version = version_result.stdout.strip()
-            except Exception:
-                python_version = "未知版本"
+            python_version = self._get_python_version(python_entry)
             
-            # 存储环境信息
-            env_info = {
+            return {
                 "name": env_name,
                 "path": env_path,
                 "python_path": python_exe,
-                "version": python_version
+                "version": python_version,
+                # 预先生成详情文本，切换选择时直接使用
+                "details": f"环境名称: {env_name}\nPython版本: {python_version}\n解释器路径: {python_exe}"
             }
-            
-            self.environments.append(env_info)
-            self.env_combo.addItem(f"{env_name} ({python_version})")
-            return True
         except Exception as e:
-            print(f"添加环境 {env_name} 失败: {str(e)}")
-            return False
+            print(f"探测环境 {env_name} 失败: {str(e)}")
+            return None
+    
+    def _add_environment(self, index, env_info):
+        """按候选顺序将环境插入列表"""
+        position = bisect.bisect(self.env_order, index)
+        self.env_order.insert(position, index)
+        self.environments.insert(position, env_info)
+        self.env_combo.insertItem(position, f"{env_info['name']} ({env_info['version']})")
     
     def update_env_details(self, index):
         """更新环境详情显示"""
         if index >= 0 and index < len(self.environments):
-            env = self.environments[index]
-            details = f"环境名称: {env['name']}\n"
-            details += f"Python版本: {env['version']}\n"
-            details += f"解释器路径: {env['python_path']}"
-            self.env_details.setText(details)
+            self.env_details.setText(self.environments[index]["details"])
     
     def select_python_file(self):
         """选择Python文件"""
@@ -217,45 +377,34 @@ class AnacondaEnvSelector(QMainWindow):
         # 确定是否隐藏窗口
         hide_window = self.hide_window_checkbox.isChecked()
         
-        # 生成VBS脚本内容
-        vbs_content = 'Set WshShell = CreateObject("WScript.Shell")\n'
-        vbs_content += 'Set fso = CreateObject("Scripting.FileSystemObject")\n\n'
-        vbs_content += "' 获取脚本所在目录\n"
-        vbs_content += 'strPath = fso.GetParentFolderName(WScript.ScriptFullName)\n\n'
-        
         # 构建命令行 - 使用activate.bat激活环境
         anaconda_dir = self.anaconda_path.text()
         activate_path = os.path.join(anaconda_dir, "Scripts", "activate.bat")
         
-        # 确保使用正确的Python解释器
-        python_exe = env['python_path']
-        # 获取python.exe路径（无论原始路径是python.exe还是pythonw.exe）
-        if python_exe.lower().endswith('pythonw.exe'):
-            python_exe = python_exe.replace('pythonw.exe', 'python.exe')
-        
-        # 获取pythonw.exe路径（用于隐藏窗口模式）
-        pythonw_exe = python_exe.replace('python.exe', 'pythonw.exe')
+        # 由环境目录直接得到python.exe和pythonw.exe（用于隐藏窗口模式）的路径
+        python_exe = os.path.join(env['path'], 'python.exe')
+        pythonw_exe = os.path.join(env['path'], 'pythonw.exe')
         
         py_filename = os.path.basename(python_file)
         
         if hide_window:
             # 隐藏窗口模式 - 使用pythonw.exe
-            vbs_content += "' 使用完整的激活命令并运行程序（隐藏窗口）\n"
-            vbs_content += 'cmd = "cmd /c call ""' + activate_path.replace('\\', '\\\\') + '"" ' + env['name'] + ' && " & _\n'
-            vbs_content += '      """' + pythonw_exe.replace('\\', '\\\\') + '"" """ & strPath & "\\' + py_filename + '"""\n\n'
-            vbs_content += "WshShell.Run cmd, 0, True\n"
+            vbs_content = _VBS_HIDE_TMPL.format_map({
+                "activate": activate_path.translate(_BS_TABLE),
+                "env": env['name'],
+                "pythonw": pythonw_exe.translate(_BS_TABLE),
+                "pyfile": py_filename,
+            })
         else:
             # 显示窗口和输出模式 - 创建一个批处理文件来运行Python脚本
             bat_file = os.path.splitext(python_file)[0] + "_runner.bat"
-            bat_content = '@echo off\n'
-            bat_content += 'call "' + activate_path + '" ' + env['name'] + '\n'
-            bat_content += 'echo 正在使用环境: ' + env['name'] + '\n'
-            bat_content += 'echo 运行Python脚本: ' + py_filename + '\n'
-            bat_content += 'echo.\n'
-            bat_content += '"' + python_exe + '" "' + python_file + '"\n'
-            bat_content += 'echo.\n'
-            bat_content += 'echo 脚本执行完毕，按任意键退出...\n'
-            bat_content += 'pause > nul\n'
+            bat_content = _BAT_TMPL.format_map({
+                "activate": activate_path,
+                "env": env['name'],
+                "pyfile": py_filename,
+                "python": python_exe,
+                "python_file": python_file,
+            })
             
             # 写入批处理文件
             try:
@@ -266,14 +415,11 @@ class AnacondaEnvSelector(QMainWindow):
                 return
             
             # VBS调用批处理文件
-            vbs_content += "' 使用批处理文件运行Python脚本（显示窗口和输出）\n"
-            vbs_content += 'batFile = strPath & "\\' + os.path.basename(bat_file) + '"\n'
-            vbs_content += 'WshShell.Run "cmd /c """ & batFile & """", 1, False\n'
+            vbs_content = _VBS_SHOW_TMPL.format_map({"batfile": os.path.basename(bat_file)})
         
         try:
-            # 写入VBS文件
-            with open(vbs_file, "w") as f:
-                f.write(vbs_content)
+            # 写入VBS文件（WScript按系统ANSI编码读取，保持默认编码）
+            Path(vbs_file).write_text(vbs_content)
             
             QMessageBox.information(
                 self, 
@@ -109,11 +109,6 @@ class APIClientBase(ABC):
         pass
 
 
-# 导入具体实现客户端
-from clients.groq_client import GroqClient
-from clients.deepgram_client import DeepgramClient
-
-
 def create_client(service: str, api_key: str, proxy: Optional[str] = None) -> APIClientBase:
     """
     创建API客户端
@@ -128,9 +123,12 @@ def create_client(service: str, api_key: str, proxy: Optional[str] = None) -> AP
     """
     print_debug(f"创建API客户端: service={service}")
 
+    # 按需导入具体实现客户端
     if service == "groq":
+        from clients.groq_client import GroqClient
         return GroqClient(api_key, proxy)
     elif service == "deepgram":
+        from clients.deepgram_client import DeepgramClient
         return DeepgramClient(api_key, proxy)
     else:
         error_msg = f"不支持的服务类型: {service}"
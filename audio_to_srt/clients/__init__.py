@@ -1,5 +1,14 @@
 # 使clients文件夹成为可导入的包
-from .groq_client import GroqClient
-from .deepgram_client import DeepgramClient
+# 客户端按需导入（PEP 562），只使用一种服务时不加载另一个客户端模块
 
 __all__ = ['GroqClient', 'DeepgramClient']
+
+
+def __getattr__(name):
+    if name == 'GroqClient':
+        from .groq_client import GroqClient
+        return GroqClient
+    if name == 'DeepgramClient':
+        from .deepgram_client import DeepgramClient
+        return DeepgramClient
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,8 +1,23 @@
+import io
 import os
 import configparser
 import json
+import threading
+from contextlib import contextmanager, nullcontext
 from typing import Dict, Any, Optional
 
+# 优先使用orjson解析/序列化转换设置，未安装时回退到标准库json
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+
+    def _json_dumps(obj):
+        return orjson.dumps(obj).decode("utf-8")
+except ImportError:
+    _json_loads = json.loads
+    _json_dumps = json.dumps
+
 # 配置文件路径
 CONFIG_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "config.ini")
 
@@ -40,37 +55,111 @@ DEFAULT_CONFIG = {
 }
 
 
+# 已解析配置的缓存，以配置文件的mtime校验是否失效（工作线程也会读取配置，需加锁）
+_config_lock = threading.RLock()
+_config_cache = {"mtime": None, "config": None, "conversion_settings": None, "key_index": {}}
+
+
+def _clear_derived_cache():
+    """清除由配置派生的缓存（转换设置、密钥反向索引）"""
+    _config_cache["conversion_settings"] = None
+    _config_cache["key_index"] = {}
+
+
+def _invalidate_key_index(section):
+    """密钥节被修改后清除其反向索引"""
+    _config_cache["key_index"].pop(section, None)
+
+
+def _config_mtime():
+    """获取配置文件的修改时间，文件不存在时返回None"""
+    try:
+        return os.stat(CONFIG_FILE).st_mtime_ns
+    except OSError:
+        return None
+
+
 def load_config():
     """加载配置文件"""
-    config = configparser.ConfigParser()
+    with _config_lock:
+        mtime = _config_mtime()
+        if mtime is not None and _config_cache["mtime"] == mtime:
+            return _config_cache["config"]
 
-    # 如果配置文件不存在，创建默认配置
-    if not os.path.exists(CONFIG_FILE):
-        for section, items in DEFAULT_CONFIG.items():
-            config[section] = items
+        config = configparser.ConfigParser()
 
-        with open(CONFIG_FILE, 'w', encoding='utf-8') as f:
-            config.write(f)
-    else:
-        config.read(CONFIG_FILE, encoding='utf-8')
+        # 如果配置文件不存在，创建默认配置
+        if mtime is None:
+            for section, items in DEFAULT_CONFIG.items():
+                config[section] = items
+
+            save_config(config)
+        else:
+            config.read(CONFIG_FILE, encoding='utf-8')
+
+            # 确保所有必要的部分都存在
+            for section, items in DEFAULT_CONFIG.items():
+                if section not in config:
+                    config[section] = {}
 
-        # 确保所有必要的部分都存在
-        for section, items in DEFAULT_CONFIG.items():
-            if section not in config:
-                config[section] = {}
+                # 确保每个部分都有必要的键
+                for key, value in items.items():
+                    if key not in config[section]:
+                        config[section][key] = value
 
-            # 确保每个部分都有必要的键
-            for key, value in items.items():
-                if key not in config[section]:
-                    config[section][key] = value
+            _config_cache["mtime"] = mtime
+            _config_cache["config"] = config
+            _clear_derived_cache()
 
-    return config
+        return config
 
 
 def save_config(config):
-    """保存配置到文件"""
-    with open(CONFIG_FILE, 'w', encoding='utf-8') as f:
-        config.write(f)
+    """保存配置到文件（先写临时文件再替换，避免写入中断导致配置损坏）"""
+    with _config_lock:
+        # 先在内存中生成完整内容，一次编码、一次写入
+        buffer = io.StringIO()
+        config.write(buffer)
+        data = buffer.getvalue().encode('utf-8')
+
+        # 写回的是缓存中的同一配置对象时，密钥反向索引由修改密钥的函数各自失效，其余情况全部清除
+        same_config = config is _config_cache["config"]
+        _config_cache["mtime"] = None
+        tmp_file = CONFIG_FILE + ".tmp"
+        with open(tmp_file, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_file, CONFIG_FILE)
+        _config_cache["mtime"] = _config_mtime()
+        _config_cache["config"] = config
+        if same_config:
+            _config_cache["conversion_settings"] = None
+        else:
+            _clear_derived_cache()
+
+
+@contextmanager
+def config_transaction():
+    """配置事务：加载一次配置，退出时统一写回一次
+
+    用法:
+        with config_transaction() as config:
+            save_output_format("srt", config)
+            save_api_service("groq", config)
+    """
+    with _config_lock:
+        config = load_config()
+        try:
+            yield config
+        except BaseException:
+            # 缓存中的配置可能已被部分修改，丢弃后下次重新读取
+            _config_cache["mtime"] = None
+            raise
+        save_config(config)
+
+
+def _config_scope(config):
+    """传入配置时由外层事务负责写回，否则开启新事务"""
+    return nullcontext(config) if config is not None else config_transaction()
 
 
 def get_proxy_settings(service="groq"):
@@ -103,17 +192,25 @@ def get_proxy_settings(service="groq"):
 
 
 def get_proxy_details(service="groq"):
-    """获取代理详细设置"""
+    """获取代理详细设置
+
+    返回的字典中enabled已解析为bool，其余字段为字符串
+    （端口允许为空，由界面按文本编辑，因此保持字符串）
+    """
     config = load_config()
     section = f"{service.capitalize()}Proxy"
 
     if section not in config:
-        return DEFAULT_CONFIG[section]
+        details = dict(DEFAULT_CONFIG[section])
+        details["enabled"] = False
+        return details
 
-    return dict(config[section])
+    details = dict(config[section])
+    details["enabled"] = config[section].getboolean("enabled", fallback=False)
+    return details
 
 
-def save_proxy_settings(settings, service="groq"):
+def save_proxy_settings(settings, service="groq", config=None):
     """保存代理设置
 
     参数:
@@ -127,18 +224,29 @@ def save_proxy_settings(settings, service="groq"):
         "password": 密码(可选)
       }
     - service: 服务名称("groq"或"deepgram")
+    - config: 外层config_transaction的配置对象(可选)
     """
-    config = load_config()
     section = f"{service.capitalize()}Proxy"
 
-    if section not in config:
-        config[section] = {}
+    with _config_scope(config) as config:
+        if section not in config:
+            config[section] = {}
 
-    for key, value in settings.items():
-        if key in ["enabled", "type", "host", "port", "username", "password"]:
-            config[section][key] = str(value)
+        for key, value in settings.items():
+            if key in ["enabled", "type", "host", "port", "username", "password"]:
+                config[section][key] = str(value)
 
-    save_config(config)
+
+def save_all_proxy_settings(settings_by_service, config=None):
+    """一次写入多个服务的代理设置
+
+    参数:
+    - settings_by_service: {服务名称: 代理设置字典}
+    - config: 外层config_transaction的配置对象(可选)
+    """
+    with _config_scope(config) as config:
+        for service, settings in settings_by_service.items():
+            save_proxy_settings(settings, service, config)
 
 
 def get_last_directory():
@@ -147,11 +255,10 @@ def get_last_directory():
     return config['Settings'].get('last_directory', '')
 
 
-def save_last_directory(directory):
+def save_last_directory(directory, config=None):
     """保存上次打开的目录"""
-    config = load_config()
-    config['Settings']['last_directory'] = directory
-    save_config(config)
+    with _config_scope(config) as config:
+        config['Settings']['last_directory'] = directory
 
 
 def get_last_used_key_name(service="groq"):
@@ -189,45 +296,45 @@ def get_api_service():
     return config['Settings']['api_service']
 
 
-def save_last_used_key(key, service="groq"):
+def _get_key_index(config, section):
+    """获取密钥值到密钥名称的反向索引（同值时保留第一个名称）"""
+    index = _config_cache["key_index"].get(section)
+    if index is None:
+        index = {}
+        for name, value in config[section].items():
+            index.setdefault(value, name)
+        _config_cache["key_index"][section] = index
+    return index
+
+
+def save_last_used_key(key, service="groq", config=None):
     """保存上次使用的API密钥
 
     参数:
     - key: API密钥值
     - service: 服务名称
+    - config: 外层config_transaction的配置对象(可选)
     """
-    config = load_config()
-    key_name = ""
-
-    # 查找密钥对应的名称
-    if service == "deepgram":
-        for name, value in config['DeepgramKeys'].items():
-            if value == key:
-                key_name = name
-                break
-        config['Settings']['last_used_deepgram_key_name'] = key_name
-    else:
-        for name, value in config['APIKeys'].items():
-            if value == key:
-                key_name = name
-                break
-        config['Settings']['last_used_key_name'] = key_name
-
-    save_config(config)
+    with _config_scope(config) as config:
+        # 查找密钥对应的名称
+        if service == "deepgram":
+            key_name = _get_key_index(config, 'DeepgramKeys').get(key, "")
+            config['Settings']['last_used_deepgram_key_name'] = key_name
+        else:
+            key_name = _get_key_index(config, 'APIKeys').get(key, "")
+            config['Settings']['last_used_key_name'] = key_name
 
 
-def save_output_format(format_type):
+def save_output_format(format_type, config=None):
     """保存输出格式设置"""
-    config = load_config()
-    config['Settings']['output_format'] = format_type
-    save_config(config)
+    with _config_scope(config) as config:
+        config['Settings']['output_format'] = format_type
 
 
-def save_api_service(service):
+def save_api_service(service, config=None):
     """保存当前使用的API服务"""
-    config = load_config()
-    config['Settings']['api_service'] = service
-    save_config(config)
+    with _config_scope(config) as config:
+        config['Settings']['api_service'] = service
 
 
 def get_api_keys(service="groq"):
@@ -240,48 +347,79 @@ def get_api_keys(service="groq"):
 
 def add_api_key(name, key, service="groq"):
     """添加API密钥"""
-    config = load_config()
-    if service == "deepgram":
-        config['DeepgramKeys'][name] = key
-    else:
-        config['APIKeys'][name] = key
-    save_config(config)
+    with _config_lock:
+        config = load_config()
+        section = 'DeepgramKeys' if service == "deepgram" else 'APIKeys'
+        config[section][name] = key
+        _invalidate_key_index(section)
+        save_config(config)
 
 
 def remove_api_key(name, service="groq"):
     """删除API密钥"""
-    config = load_config()
-    section = 'DeepgramKeys' if service == "deepgram" else 'APIKeys'
+    with _config_lock:
+        config = load_config()
+        section = 'DeepgramKeys' if service == "deepgram" else 'APIKeys'
 
-    if name in config[section]:
-        del config[section][name]
-        save_config(config)
+        if name in config[section]:
+            del config[section][name]
+            _invalidate_key_index(section)
+            save_config(config)
 
 
-def get_conversion_settings():
-    """获取转换设置"""
-    config = load_config()
-    # 修复：使用字符串访问ConversionSettings节
-    if 'ConversionSettings' in config:
-        settings_json = config['ConversionSettings'].get('settings', '{}')
-    else:
-        settings_json = '{}'
+def apply_key_changes(service="groq", adds=None, removes=(), config=None):
+    """批量应用API密钥的增删，只读写一次配置文件
 
-    try:
-        return json.loads(settings_json)
-    except json.JSONDecodeError:
-        return {}
+    参数:
+    - service: 服务名称
+    - adds: 要添加的密钥 {名称: 密钥值}
+    - removes: 要删除的密钥名称
+    - config: 外层config_transaction的配置对象(可选)
+    """
+    section = 'DeepgramKeys' if service == "deepgram" else 'APIKeys'
+
+    with _config_scope(config) as config:
+        for name in removes:
+            if name in config[section]:
+                del config[section][name]
 
+        for name, key in (adds or {}).items():
+            config[section][name] = key
 
-def save_conversion_settings(settings):
+        _invalidate_key_index(section)
+
+
+def get_conversion_settings():
+    """获取转换设置（解析结果随配置缓存一起失效）"""
+    with _config_lock:
+        config = load_config()
+        settings = _config_cache["conversion_settings"]
+        if settings is None:
+            # 修复：使用字符串访问ConversionSettings节
+            if 'ConversionSettings' in config:
+                settings_json = config['ConversionSettings'].get('settings', '{}')
+            else:
+                settings_json = '{}'
+
+            try:
+                settings = _json_loads(settings_json)
+            except json.JSONDecodeError:
+                settings = {}
+            _config_cache["conversion_settings"] = settings
+
+        # 返回浅拷贝，调用方替换顶层键时不会影响缓存
+        return dict(settings)
+
+
+def save_conversion_settings(settings, config=None):
     """保存转换设置
 
     参数:
     - settings: 设置字典
+    - config: 外层config_transaction的配置对象(可选)
     """
-    config = load_config()
-    if 'ConversionSettings' not in config:
-        config['ConversionSettings'] = {}
+    with _config_scope(config) as config:
+        if 'ConversionSettings' not in config:
+            config['ConversionSettings'] = {}
 
-    config['ConversionSettings']['settings'] = json.dumps(settings)
-    save_config(config)
\ No newline at end of file
+        config['ConversionSettings']['settings'] = _json_dumps(settings)
\ No newline at end of file
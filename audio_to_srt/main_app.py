@@ -1,7 +1,48 @@
+import os
 import sys
+import sysconfig
+import importlib.metadata
 import importlib.util
 from PySide6.QtWidgets import QApplication, QMessageBox
 
+# 关键依赖（发行包名，同时也是导入名）
+REQUIRED_PACKAGES = ["PySide6", "httpx"]
+
+# 依赖检查通过的标记文件，比site-packages新时跳过检查
+DEPS_OK_FILE = os.path.join(os.path.expanduser("~"), ".cache", "audio_to_srt", "deps_ok")
+
+
+def find_missing_packages():
+    """查找缺少的依赖包"""
+    try:
+        site_mtime = os.stat(sysconfig.get_paths()["purelib"]).st_mtime_ns
+        if os.stat(DEPS_OK_FILE).st_mtime_ns >= site_mtime:
+            return []
+    except OSError:
+        pass
+
+    # 一次性读取已安装的发行包名称
+    installed = set()
+    for dist in importlib.metadata.distributions():
+        name = dist.metadata["Name"]
+        if name:
+            installed.add(name.lower())
+
+    # 发行包名与导入名不同的安装（如只装了PySide6-Essentials）查不到元数据，再按导入名确认
+    missing = [name for name in REQUIRED_PACKAGES
+               if name.lower() not in installed and importlib.util.find_spec(name) is None]
+
+    if not missing:
+        try:
+            os.makedirs(os.path.dirname(DEPS_OK_FILE), exist_ok=True)
+            with open(DEPS_OK_FILE, "w", encoding="utf-8") as f:
+                f.write(sys.prefix)
+        except OSError:
+            pass
+
+    return missing
+
+
 if __name__ == "__main__":
     app = QApplication(sys.argv)
     
@@ -9,10 +50,7 @@ if __name__ == "__main__":
     app.setStyle("Fusion")
     
     # 检查关键依赖
-    missing_modules = []
-    for module_name in ["PySide6", "httpx"]:
-        if importlib.util.find_spec(module_name) is None:
-            missing_modules.append(module_name)
+    missing_modules = find_missing_packages()
     
     if missing_modules:
         error_msg = "缺少必要的依赖项: " + ", ".join(missing_modules) + "\n\n"
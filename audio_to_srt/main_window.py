@@ -42,6 +42,7 @@ class MainWindow(QMainWindow, UIInitMixin, MethodsMixin, ProcessingMixin, Events
         # 初始化变量
         self.process_worker = None
         self.file_progress = {}  # 文件进度跟踪
+        self._refresh_pending = False  # 是否已安排界面状态刷新
 
         # 初始化UI
         self.init_ui()
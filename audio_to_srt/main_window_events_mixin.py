@@ -20,30 +20,34 @@ class EventsMixin:
             )
 
             if reply == QMessageBox.Yes:
-                # 终止工作线程
-                self.process_worker.terminate()
-                self.process_worker.wait()
+                # 请求工作线程中断，超时后才强制终止
+                self.process_worker.requestInterruption()
+                if not self.process_worker.wait(2000):
+                    self.process_worker.terminate()
+                    self.process_worker.wait()
+                self.save_ui_settings()
                 event.accept()
             else:
                 event.ignore()
         else:
+            self.save_ui_settings()
             event.accept()
 
+    def save_ui_settings(self):
+        """退出前写入尚未保存的表格设置
+
+        服务和输出格式在切换时已即时保存，这里不再重复写入配置文件
+        """
+        self.file_list.flushPendingSettings()
+
     def dragEnterEvent(self, event):
         """拖拽进入事件处理"""
         # 改进拖放处理逻辑
         if event.mimeData().hasUrls():
-            # 检查是否有支持的音频文件
-            has_valid_file = False
-            for url in event.mimeData().urls():
-                file_path = url.toLocalFile()
-                if os.path.isfile(file_path):  # 首先确保是文件
-                    file_ext = os.path.splitext(file_path)[1].lower()
-                    if file_ext in SUPPORTED_AUDIO_EXTENSIONS:
-                        has_valid_file = True
-                        break
-
-            if has_valid_file:
+            # 检查是否有支持的音频文件，找到第一个即停止
+            # 只按扩展名判断，文件是否存在留到释放时再检查（进入事件会被频繁触发）
+            if any(url.toLocalFile().lower().endswith(SUPPORTED_AUDIO_EXTENSIONS)
+                   for url in event.mimeData().urls()):
                 event.accept()  # 显式接受事件
                 return
 
@@ -59,11 +63,9 @@ class EventsMixin:
 
             for url in urls:
                 file_path = url.toLocalFile()
-                if os.path.isfile(file_path):  # 首先确保是文件
-                    file_ext = os.path.splitext(file_path)[1].lower()
-                    # 只处理支持的音频文件
-                    if file_ext in SUPPORTED_AUDIO_EXTENSIONS:
-                        files.append(file_path)
+                # 只处理支持的音频文件，先判断扩展名再确认是文件
+                if file_path.lower().endswith(SUPPORTED_AUDIO_EXTENSIONS) and os.path.isfile(file_path):
+                    files.append(file_path)
 
             if files:
                 self.add_dropped_files(files)
@@ -209,8 +209,8 @@ class UIInitMixin:
         files_group.setLayout(files_layout)
         main_layout.addWidget(files_group)
 
-        # 连接信号
-        self.file_list.itemSelectionChanged.connect(self.update_file_buttons)
+        # 连接信号（选择变化可能连续触发多次，合并后再刷新按钮状态）
+        self.file_list.itemSelectionChanged.connect(self.schedule_ui_refresh)
 
     def init_progress_and_log(self, main_layout):
         """初始化进度和日志区域"""
@@ -1,8 +1,8 @@
 import os
 from PySide6.QtWidgets import (
-    QMessageBox, QFileDialog, QTableWidgetItem
+    QMessageBox, QFileDialog
 )
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QTimer
 from PySide6.QtGui import QPalette
 
 from config_manager import (
@@ -10,9 +10,9 @@ from config_manager import (
     get_last_directory, save_last_directory, save_last_used_key, save_output_format, save_api_service,
     get_conversion_settings
 )
-from ui_dialogs import ProxySettingsDialog, APIKeyDialog, DependencyCheckerDialog, AboutDialog
+from ui_dialogs import ProxySettingsDialog, APIKeyDialog, DependencyCheckerDialog, AboutDialog, get_dialog
 from ui_settings_dialog import ConversionSettingsDialog
-from ui_components import SUPPORTED_AUDIO_EXTENSIONS
+from ui_components import AUDIO_NAME_FILTER, DISPLAY_PATH_ROLE
 
 
 class MethodsMixin:
@@ -46,47 +46,45 @@ class MethodsMixin:
 
     def load_api_keys(self):
         """加载API密钥"""
-        # 清空当前列表
-        self.api_key_combo.clear()
-
         # 获取当前服务
         current_service = "groq" if self.groq_radio.isChecked() else "deepgram"
 
         # 获取密钥
         keys = get_api_keys(current_service)
 
-        if not keys:
-            self.api_key_combo.addItem("未配置API密钥", None)
-            self.api_key_combo.setEnabled(False)
-            return
-
-        self.api_key_combo.setEnabled(True)
-
-        # 获取上次使用的密钥名称
-        last_key_name = get_last_used_key_name(current_service)
-        last_key_index = 0
-
-        # 添加密钥到下拉列表
-        for i, (name, key) in enumerate(keys.items()):
-            # 格式化显示
-            masked_key = f"{key[:5]}...{key[-4:]}" if len(key) > 10 else key
-            display_text = f"{name}: {masked_key}" if name != key else masked_key
-            self.api_key_combo.addItem(display_text, key)
-
-            # 如果是上次使用的密钥，记录索引
-            if name == last_key_name:
-                last_key_index = i
-
-        # 选择上次使用的密钥
-        if last_key_name and last_key_index < self.api_key_combo.count():
-            self.api_key_combo.setCurrentIndex(last_key_index)
+        # 重建列表期间屏蔽信号，避免清空和逐项添加时反复触发选择变化
+        self.api_key_combo.blockSignals(True)
+        try:
+            # 清空当前列表
+            self.api_key_combo.clear()
+
+            if not keys:
+                self.api_key_combo.addItem("未配置API密钥", None)
+                self.api_key_combo.setEnabled(False)
+                return
+
+            self.api_key_combo.setEnabled(True)
+
+            # 添加密钥到下拉列表
+            for name, key in keys.items():
+                # 格式化显示
+                masked_key = f"{key[:5]}...{key[-4:]}" if len(key) > 10 else key
+                display_text = f"{name}: {masked_key}" if name != key else masked_key
+                self.api_key_combo.addItem(display_text, key)
+
+            # 选择上次使用的密钥
+            last_key_name = get_last_used_key_name(current_service)
+            if last_key_name in keys:
+                self.api_key_combo.setCurrentIndex(list(keys).index(last_key_name))
+        finally:
+            self.api_key_combo.blockSignals(False)
 
         # 更新开始按钮状态
         self.update_start_button()
 
     def open_proxy_settings(self):
         """打开代理设置对话框"""
-        dialog = ProxySettingsDialog(self)
+        dialog = get_dialog(ProxySettingsDialog, self)
         # 确保对话框显示在前面并设置模态
         dialog.setWindowModality(Qt.ApplicationModal)
         dialog.raise_()
@@ -96,16 +94,18 @@ class MethodsMixin:
     def open_api_key_manager(self):
         """打开API密钥管理对话框"""
         current_service = "groq" if self.groq_radio.isChecked() else "deepgram"
-        dialog = APIKeyDialog(self, current_service)
+        dialog = get_dialog(
+            APIKeyDialog, self, current_service,
+            on_create=lambda d: d.keys_changed.connect(self.load_api_keys)
+        )
         # 确保对话框大小足够避免重叠，并设置模态
         dialog.setWindowModality(Qt.ApplicationModal)
         dialog.setMinimumSize(550, 350)
         dialog.raise_()
         dialog.activateWindow()
-        dialog.exec()
 
-        # 对话框关闭后刷新API密钥
-        self.load_api_keys()
+        # 密钥有改动时对话框会通过keys_changed信号刷新API密钥
+        dialog.exec()
 
     def open_conversion_settings(self):
         """打开转换设置对话框"""
@@ -130,13 +130,13 @@ class MethodsMixin:
 
     def check_dependencies(self):
         """检查依赖"""
-        dialog = DependencyCheckerDialog(self)
+        dialog = get_dialog(DependencyCheckerDialog, self)
         dialog.setWindowModality(Qt.ApplicationModal)
         dialog.exec()
 
     def show_about(self):
         """显示关于对话框"""
-        dialog = AboutDialog(self)
+        dialog = get_dialog(AboutDialog, self)
         dialog.setWindowModality(Qt.ApplicationModal)
         dialog.exec()
 
@@ -161,15 +161,14 @@ class MethodsMixin:
         """添加文件"""
         # 获取上次打开的目录
         last_dir = get_last_directory()
-        start_dir = last_dir if last_dir and os.path.exists(last_dir) else ""
 
         file_dialog = QFileDialog(self)
         file_dialog.setFileMode(QFileDialog.ExistingFiles)
-        file_dialog.setNameFilter(f"音频文件 ({' '.join(['*' + ext for ext in SUPPORTED_AUDIO_EXTENSIONS])})")
+        file_dialog.setNameFilter(AUDIO_NAME_FILTER)
 
-        # 设置起始目录
-        if start_dir:
-            file_dialog.setDirectory(start_dir)
+        # 设置起始目录（目录不存在时QFileDialog会自行回退，无需预先检查）
+        if last_dir:
+            file_dialog.setDirectory(last_dir)
 
         if file_dialog.exec():
             files = file_dialog.selectedFiles()
@@ -183,33 +182,30 @@ class MethodsMixin:
 
     def add_dropped_files(self, files):
         """添加拖放的文件"""
-        for file_path in files:
-            # 检查文件是否已在列表中
-            found = False
-            for path in self.file_list.get_all_file_paths():
-                if path == file_path:
-                    found = True
-                    break
+        # 已在列表中的文件，一次取出后用集合判断重复
+        existing = set(self.file_list.get_all_file_paths())
 
-            if not found:
-                # 添加文件到表格
-                row = self.file_list.add_audio_file(file_path)
+        with self.file_list.batch_update():
+            for file_path in files:
+                if file_path not in existing:
+                    # 添加文件到表格
+                    row = self.file_list.add_audio_file(file_path)
+                    existing.add(file_path)
 
-                # 选中新添加的行
-                self.file_list.selectRow(row)
+                    # 选中新添加的行
+                    self.file_list.selectRow(row)
 
         # 更新UI状态
         self.update_file_buttons()
 
+    def _selected_rows(self):
+        """获取选中的行号（按行选择，只需遍历第一列的索引）"""
+        return [index.row() for index in self.file_list.selectionModel().selectedRows()]
+
     def remove_files(self):
         """删除所选文件"""
-        # 获取选中的行索引
-        selected_rows = set()
-        for item in self.file_list.selectedItems():
-            selected_rows.add(item.row())
-
         # 按照索引从大到小的顺序删除行（避免索引变化）
-        for row in sorted(selected_rows, reverse=True):
+        for row in sorted(self._selected_rows(), reverse=True):
             self.file_list.removeRow(row)
 
         # 更新UI状态
@@ -218,36 +214,52 @@ class MethodsMixin:
     def clear_files(self):
         """清空文件列表"""
         # 删除所有行
-        self.file_list.setRowCount(0)
+        with self.file_list.batch_update():
+            self.file_list.setRowCount(0)
 
         # 更新UI状态
         self.update_file_buttons()
 
-    def update_file_buttons(self):
-        """更新文件操作按钮状态"""
+    def schedule_ui_refresh(self):
+        """合并短时间内的多次选择变化，只在事件循环空闲时刷新一次"""
+        if self._refresh_pending:
+            return
+        self._refresh_pending = True
+        QTimer.singleShot(0, self._refresh_ui_state)
+
+    def _refresh_ui_state(self):
+        """一次遍历选择状态，更新文件操作按钮和开始按钮"""
+        self._refresh_pending = False
+
         has_files = self.file_list.rowCount() > 0
-        has_selection = len(self.file_list.selectedItems()) > 0
+        selected_rows = self._selected_rows()
+        has_selection = bool(selected_rows)
+        has_api_key = self.api_key_combo.isEnabled() and self.api_key_combo.currentData() is not None
 
         self.remove_file_btn.setEnabled(has_selection)
         self.clear_files_btn.setEnabled(has_files)
         self.select_all_checkbox.setEnabled(has_files)
 
-        # 检查是否全选 - 计算方式是通过选中项数量和表格的总单元格数量比较
-        if has_files and has_selection:
-            # 计算选中项的行数
-            selected_rows = set()
-            for item in self.file_list.selectedItems():
-                selected_rows.add(item.row())
-            all_selected = len(selected_rows) == self.file_list.rowCount()
-        else:
-            all_selected = False
+        # 检查是否全选 - 比较选中行数和表格总行数
+        all_selected = has_files and len(selected_rows) == self.file_list.rowCount()
 
         # 更新复选框状态，但避免触发信号
         self.select_all_checkbox.blockSignals(True)
         self.select_all_checkbox.setChecked(all_selected)
         self.select_all_checkbox.blockSignals(False)
 
-        self.update_start_button()
+        # 如果有选中文件且有API密钥，则启用开始按钮
+        self.start_btn.setEnabled(has_selection and has_api_key)
+
+        # 根据文件列表状态更新按钮文本
+        if has_selection:
+            self.start_btn.setText(f"开始转换 ({len(selected_rows)}个文件)")
+        else:
+            self.start_btn.setText("开始转换")
+
+    def update_file_buttons(self):
+        """更新文件操作按钮状态"""
+        self._refresh_ui_state()
 
     def toggle_select_all(self, checked):
         """切换全选/取消全选"""
@@ -265,18 +277,7 @@ class MethodsMixin:
 
     def update_start_button(self):
         """更新开始按钮状态"""
-        has_selection = len(self.file_list.selectedItems()) > 0 and len(self.file_list.get_selected_file_paths()) > 0
-        has_api_key = self.api_key_combo.isEnabled() and self.api_key_combo.currentData() is not None
-
-        # 如果有选中文件且有API密钥，则启用开始按钮
-        self.start_btn.setEnabled(has_selection and has_api_key)
-
-        # 根据文件列表状态更新按钮文本
-        if has_selection:
-            file_count = len(set(item.row() for item in self.file_list.selectedItems()))
-            self.start_btn.setText(f"开始转换 ({file_count}个文件)")
-        else:
-            self.start_btn.setText("开始转换")
+        self._refresh_ui_state()
 
     def _update_file_status(self, file_path, status):
         """更新表格中文件的状态
@@ -284,13 +285,14 @@ class MethodsMixin:
         这是一个辅助方法，用于在表格中查找并更新文件状态
         """
         # 查找文件所在的行
-        for row in range(self.file_list.rowCount()):
-            item = self.file_list.item(row, 0)  # 第一列存储文件路径
-            if item and item.data(Qt.UserRole) == file_path:
-                # 获取文件路径并添加状态信息
-                file_path_formatted = file_path.replace("/", "\\")
-                status_label = f"{file_path_formatted} ({status})"
-
-                # 更新表格项的显示文本
-                item.setText(status_label)
-                break
\ No newline at end of file
+        row = self.file_list.get_file_row(file_path)
+        if row is None:
+            return
+        item = self.file_list.item(row, 0)  # 第一列存储文件路径
+        if item:
+            # 获取文件路径并添加状态信息
+            file_path_formatted = item.data(DISPLAY_PATH_ROLE)
+            status_label = f"{file_path_formatted} ({status})"
+
+            # 更新表格项的显示文本
+            item.setText(status_label)
\ No newline at end of file
@@ -118,13 +118,14 @@ class ProcessingMixin:
         self.conversion_settings_btn.setEnabled(enabled)
 
         # 文件操作
+        has_selection = bool(self._selected_rows())
         self.add_file_btn.setEnabled(enabled)
-        self.remove_file_btn.setEnabled(enabled and self.file_list.selectedItems())
+        self.remove_file_btn.setEnabled(enabled and has_selection)
         self.clear_files_btn.setEnabled(enabled and self.file_list.rowCount() > 0)
         self.select_all_checkbox.setEnabled(enabled and self.file_list.rowCount() > 0)
 
         # 开始按钮
-        self.start_btn.setEnabled(enabled and self.file_list.selectedItems())
+        self.start_btn.setEnabled(enabled and has_selection)
 
         # 代理按钮
         self.proxy_btn.setEnabled(enabled)
@@ -138,8 +139,8 @@ class ProcessingMixin:
 
     def on_file_started(self, file_path):
         """文件开始处理"""
-        # 使用Windows路径格式
-        file_path_formatted = file_path.replace("/", "\\")
+        # 使用系统路径格式
+        file_path_formatted = os.path.normpath(file_path)
         self.log(f"开始处理: {file_path_formatted}")
 
         # 查找并更新表格项
@@ -147,9 +148,9 @@ class ProcessingMixin:
 
     def on_file_finished(self, file_path, output_path):
         """文件处理完成"""
-        # 使用Windows路径格式
-        file_path_formatted = file_path.replace("/", "\\")
-        output_path_formatted = output_path.replace("/", "\\")
+        # 使用系统路径格式
+        file_path_formatted = os.path.normpath(file_path)
+        output_path_formatted = os.path.normpath(output_path)
 
         self.log(f"处理完成: {file_path_formatted} -> {output_path_formatted}")
 
@@ -161,8 +162,8 @@ class ProcessingMixin:
 
     def on_file_error(self, file_path, error_message):
         """文件处理错误"""
-        # 使用Windows路径格式
-        file_path_formatted = file_path.replace("/", "\\")
+        # 使用系统路径格式
+        file_path_formatted = os.path.normpath(file_path)
 
         self.log(f"处理失败: {file_path_formatted} - {error_message}")
 
@@ -192,16 +193,17 @@ class ProcessingMixin:
         这是一个新增的辅助方法，用于在表格中查找并更新文件状态
         """
         # 查找文件所在的行
-        for row in range(self.file_list.rowCount()):
-            item = self.file_list.item(row, 0)  # 第一列存储文件名
-            if item and item.data(Qt.UserRole) == file_path:
-                # 文件名加上状态信息
-                file_name = os.path.basename(file_path)
-                status_label = f"{file_name} ({status})"
-
-                # 更新表格项的显示文本
-                item.setText(status_label)
-                break
+        row = self.file_list.get_file_row(file_path)
+        if row is None:
+            return
+        item = self.file_list.item(row, 0)  # 第一列存储文件名
+        if item:
+            # 文件名加上状态信息
+            file_name = os.path.basename(file_path)
+            status_label = f"{file_name} ({status})"
+
+            # 更新表格项的显示文本
+            item.setText(status_label)
 
     def update_overall_progress(self):
         """更新总体进度条"""
@@ -0,0 +1,63 @@
+"""各转写服务的高级选项"""
+from dataclasses import dataclass, field, fields
+from typing import Any, Optional
+
+
+@dataclass(frozen=True)
+class GroqSettings:
+    """Groq转写选项（默认值与GroqClient.transcribe保持一致）"""
+    model: str = "whisper-large-v3"
+    timestamps: str = "granular"
+    temperature: float = 0.0
+    translate: bool = False
+    max_line_count: int = 2
+    max_line_width: int = 42
+
+
+@dataclass(frozen=True)
+class DeepgramSettings:
+    """Deepgram转写选项（默认值与DeepgramClient.transcribe保持一致）"""
+    model: str = "nova-2"
+    version: str = "latest"
+    smart_format: bool = True
+    punctuate: bool = True
+    diarize: bool = False
+    detect_language: bool = True
+    multichannel: bool = False
+    keywords: Any = field(default_factory=list)
+    tier: str = "base"
+    sample_rate: Optional[Any] = None
+    timestamps: str = "word"
+    confidence: float = 0.7
+
+
+# 服务名称 -> 选项类
+SERVICE_SETTINGS_CLASSES = {
+    "groq": GroqSettings,
+    "deepgram": DeepgramSettings,
+}
+
+# 各服务支持的选项键
+_GROQ_KEYS = frozenset(f.name for f in fields(GroqSettings))
+_DEEPGRAM_KEYS = frozenset(f.name for f in fields(DeepgramSettings))
+_SERVICE_KEYS = {
+    "groq": _GROQ_KEYS,
+    "deepgram": _DEEPGRAM_KEYS,
+}
+
+
+def make_service_settings(service, settings):
+    """从转换设置字典构造服务选项，忽略该服务不支持的键
+
+    参数:
+    - service: 服务名称("groq"或"deepgram")
+    - settings: 该服务的转换设置字典
+
+    返回:
+    - 选项对象，未知服务返回None
+    """
+    cls = SERVICE_SETTINGS_CLASSES.get(service)
+    if cls is None:
+        return None
+
+    return cls(**{key: settings[key] for key in settings.keys() & _SERVICE_KEYS[service]})
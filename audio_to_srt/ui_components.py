@@ -1,17 +1,129 @@
 import os
+import json
+from contextlib import contextmanager
 import av
 from PySide6.QtWidgets import (
     QTableWidget, QTableWidgetItem, QProgressBar, QAbstractItemView,
     QHeaderView, QStyledItemDelegate, QStyleOptionViewItem, QStyle
 )
-from PySide6.QtCore import Qt, Signal, QMimeData, QUrl, QEvent, QSize, QSettings, QPoint
+from PySide6.QtCore import (
+    Qt, Signal, QMimeData, QUrl, QEvent, QSize, QSettings, QPoint,
+    QObject, QRunnable, QThreadPool, QTimer
+)
 from PySide6.QtGui import QResizeEvent
 
 # 支持的音频文件扩展名
-SUPPORTED_AUDIO_EXTENSIONS = [
+SUPPORTED_AUDIO_EXTENSIONS = (
     ".mp3", ".mp4", ".m4a", ".wav", ".ogg", ".opus",
     ".mpeg", ".mpga", ".webm", ".flac"
-]
+)
+
+# 表格第一列中保存规范化显示路径的数据角色（Qt.UserRole保存原始路径）
+DISPLAY_PATH_ROLE = Qt.UserRole + 1
+
+# 文件对话框的名称过滤器
+AUDIO_NAME_FILTER = "音频文件 (" + " ".join("*" + ext for ext in SUPPORTED_AUDIO_EXTENSIONS) + ")"
+
+# 元数据列（时长、采样率、通道、格式、比特率）的数量，对应表格第1~5列
+METADATA_COLUMN_COUNT = 5
+
+
+def probe_audio_metadata(file_path):
+    """使用PyAV提取音频元数据
+
+    返回:
+    - 时长、采样率、通道、格式、比特率的显示文本列表
+    """
+    container = None
+    try:
+        container = av.open(file_path)
+        audio_streams = container.streams.audio
+        audio_stream = audio_streams[0] if audio_streams else None
+
+        if audio_stream:
+            # 计算时长
+            duration = container.duration / 1000000.0 if container.duration else 0  # 转换为秒
+            minutes = int(duration // 60)
+            seconds = int(duration % 60)
+            time_str = f"{minutes:02d}:{seconds:02d}"
+
+            # 采样率
+            sample_rate = f"{audio_stream.sample_rate // 1000}kHz" if audio_stream.sample_rate else "未知"
+
+            # 通道数
+            channels = str(audio_stream.channels) if audio_stream.channels else "未知"
+
+            # 文件格式
+            format_name = container.format.name or "未知"
+
+            # 比特率
+            stream_bit_rate = getattr(audio_stream, 'bit_rate', None)
+            bit_rate = f"{stream_bit_rate // 1000}kbps" if stream_bit_rate else "未知"
+
+            metadata = [time_str, sample_rate, channels, format_name, bit_rate]
+        else:
+            # 如果没有音频流
+            metadata = ["未知"] * METADATA_COLUMN_COUNT
+    except Exception as e:
+        # 处理错误情况
+        print(f"提取音频信息出错: {e}")
+        metadata = ["错误"] * METADATA_COLUMN_COUNT
+    finally:
+        # 关闭容器（出错时同样关闭，避免文件句柄泄漏）
+        if container is not None:
+            container.close()
+
+    return metadata
+
+
+# 元数据磁盘缓存，键为"路径|mtime|大小"，文件未变化时跳过PyAV解析
+_META_CACHE = None
+META_CACHE_MAX_ENTRIES = 2000
+
+
+def _get_meta_cache():
+    """懒加载元数据缓存"""
+    global _META_CACHE
+    if _META_CACHE is None:
+        raw = QSettings("AudioTranscriber", "MetaCache").value("cache", "")
+        try:
+            _META_CACHE = json.loads(raw) if raw else {}
+        except (TypeError, ValueError):
+            _META_CACHE = {}
+    return _META_CACHE
+
+
+def _save_meta_cache():
+    """保存元数据缓存，超出上限时丢弃最早的条目"""
+    cache = _get_meta_cache()
+    for key in list(cache)[:max(0, len(cache) - META_CACHE_MAX_ENTRIES)]:
+        del cache[key]
+    QSettings("AudioTranscriber", "MetaCache").setValue("cache", json.dumps(cache, ensure_ascii=False))
+
+
+def _centered_item(text):
+    """创建居中显示的表格项"""
+    item = QTableWidgetItem(text)
+    item.setTextAlignment(Qt.AlignCenter)
+    return item
+
+
+class ProbeSignals(QObject):
+    """元数据提取任务的信号（QRunnable本身不能定义信号）"""
+    probed = Signal(str, list)  # 文件路径, 元数据显示文本
+
+
+class ProbeTask(QRunnable):
+    """在线程池中提取单个音频文件的元数据"""
+
+    def __init__(self, file_path, cache_key=None):
+        super().__init__()
+        self.file_path = file_path
+        self.cache_key = cache_key
+        self.signals = ProbeSignals()
+
+    def run(self):
+        self.signals.probed.emit(self.file_path, probe_audio_metadata(self.file_path))
 
 
 class AudioTableWidget(QTableWidget):
@@ -25,6 +137,20 @@ class AudioTableWidget(QTableWidget):
         self.setColumnCount(7)  # 文件路径、时长、采样率、通道数、文件格式、比特率、大小
         self.setHorizontalHeaderLabels(["文件路径", "时长", "采样率", "通道", "格式", "比特率", "文件大小"])
 
+        # 文件路径 -> 行号索引，避免逐行读取单元格数据查找文件
+        self._path_to_row = {}
+
+        # 元数据在后台线程池中提取，避免打开音频文件时阻塞界面
+        self._probe_pool = QThreadPool(self)
+        self._probe_pool.setMaxThreadCount(os.cpu_count() or 1)
+        self._probe_tasks = {}  # 任务信号对象 -> 进行中的任务（保留引用直到完成）
+
+        # 元数据缓存的保存合并到一次写入
+        self._meta_save_timer = QTimer(self)
+        self._meta_save_timer.setSingleShot(True)
+        self._meta_save_timer.setInterval(1000)
+        self._meta_save_timer.timeout.connect(_save_meta_cache)
+
         # 配置表格外观和行为
         self.setAlternatingRowColors(True)
         self.setSelectionBehavior(QAbstractItemView.SelectRows)  # 整行选择
@@ -41,9 +167,16 @@ class AudioTableWidget(QTableWidget):
         for col in range(1, 7):
             self.horizontalHeader().setSectionResizeMode(col, QHeaderView.ResizeToContents)
 
-        # 加载保存的大小设置
+        # 加载保存的大小设置（复用同一个QSettings对象）
+        self._settings = QSettings("AudioTranscriber", "TableSettings")
         self.loadSettings()
 
+        # 调整大小时连续触发的保存合并为停止调整后的一次写入
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(300)
+        self._save_timer.timeout.connect(self.saveSettings)
+
         # 启用拖放功能
         self.setAcceptDrops(True)
         self.viewport().setAcceptDrops(True)
@@ -56,138 +189,156 @@ class AudioTableWidget(QTableWidget):
         if obj == self and event.type() == QEvent.Resize:
             resize_event = QResizeEvent(event.size(), event.oldSize())
             self.size_changed.emit(resize_event.size())
-            # 保存当前大小
-            self.saveSettings()
+            # 保存当前大小（延迟写入，重新计时）
+            self._save_timer.start()
         return super().eventFilter(obj, event)
 
     def saveSettings(self):
         """保存表格设置"""
-        settings = QSettings("AudioTranscriber", "TableSettings")
-        settings.setValue("tableSize", self.size())
-        settings.setValue("columnWidths", [self.columnWidth(i) for i in range(self.columnCount())])
+        self._settings.setValue("tableSize", self.size())
+        self._settings.setValue("columnWidths", [self.columnWidth(i) for i in range(self.columnCount())])
+
+    def flushPendingSettings(self):
+        """立即写入尚未保存的设置（窗口关闭时调用）"""
+        if self._save_timer.isActive():
+            self._save_timer.stop()
+            self.saveSettings()
+        if self._meta_save_timer.isActive():
+            self._meta_save_timer.stop()
+            _save_meta_cache()
 
     def loadSettings(self):
         """加载表格设置"""
-        settings = QSettings("AudioTranscriber", "TableSettings")
-        size = settings.value("tableSize")
+        size = self._settings.value("tableSize")
         if size:
             self.resize(size)
 
-        column_widths = settings.value("columnWidths")
+        column_widths = self._settings.value("columnWidths")
         if column_widths and len(column_widths) == self.columnCount():
             for i, width in enumerate(column_widths):
                 if width > 0:  # 确保宽度有效
                     self.setColumnWidth(i, width)
 
     def add_audio_file(self, file_path):
-        """添加音频文件到表格，并提取其元数据"""
+        """添加音频文件到表格，并在后台提取其元数据"""
         row = self.rowCount()
         self.insertRow(row)
 
-        # 文件路径（显示完整路径，使用Windows风格）
-        file_path_formatted = file_path.replace("/", "\\")
+        # 文件路径（显示完整路径，使用系统路径分隔符）
+        file_path_formatted = os.path.normpath(file_path)
         path_item = QTableWidgetItem(file_path_formatted)
         path_item.setData(Qt.UserRole, file_path)  # 存储原始路径
+        path_item.setData(DISPLAY_PATH_ROLE, file_path_formatted)  # 存储显示路径，更新状态时复用
         self.setItem(row, 0, path_item)
+        self._path_to_row[file_path] = row
 
         try:
-            # 使用PyAV提取音频元数据
-            container = av.open(file_path)
-            audio_stream = next((s for s in container.streams if s.type == 'audio'), None)
-
-            if audio_stream:
-                # 计算时长
-                duration = container.duration / 1000000.0 if container.duration else 0  # 转换为秒
-                minutes = int(duration // 60)
-                seconds = int(duration % 60)
-                time_str = f"{minutes:02d}:{seconds:02d}"
-                self.setItem(row, 1, QTableWidgetItem(time_str))
-
-                # 采样率
-                sample_rate = f"{audio_stream.sample_rate // 1000}kHz" if audio_stream.sample_rate else "未知"
-                self.setItem(row, 2, QTableWidgetItem(sample_rate))
-
-                # 通道数
-                channels = str(audio_stream.channels) if audio_stream.channels else "未知"
-                self.setItem(row, 3, QTableWidgetItem(channels))
-
-                # 文件格式
-                format_name = container.format.name if hasattr(container, 'format') and hasattr(container.format, 'name') else "未知"
-                self.setItem(row, 4, QTableWidgetItem(format_name))
-
-                # 比特率
-                bit_rate = f"{audio_stream.bit_rate // 1000}kbps" if hasattr(audio_stream, 'bit_rate') and audio_stream.bit_rate else "未知"
-                self.setItem(row, 5, QTableWidgetItem(bit_rate))
-            else:
-                # 如果没有音频流
-                self.setItem(row, 1, QTableWidgetItem("未知"))
-                self.setItem(row, 2, QTableWidgetItem("未知"))
-                self.setItem(row, 3, QTableWidgetItem("未知"))
-                self.setItem(row, 4, QTableWidgetItem("未知"))
-                self.setItem(row, 5, QTableWidgetItem("未知"))
-
-            # 关闭容器
-            container.close()
-        except Exception as e:
-            # 处理错误情况
-            print(f"提取音频信息出错: {e}")
-            self.setItem(row, 1, QTableWidgetItem("错误"))
-            self.setItem(row, 2, QTableWidgetItem("错误"))
-            self.setItem(row, 3, QTableWidgetItem("错误"))
-            self.setItem(row, 4, QTableWidgetItem("错误"))
-            self.setItem(row, 5, QTableWidgetItem("错误"))
-
-        # 文件大小
-        try:
-            size_bytes = os.path.getsize(file_path)
+            st = os.stat(file_path)
+        except OSError:
+            st = None
+
+        cache_key = f"{file_path}|{st.st_mtime_ns}|{st.st_size}" if st else None
+        metadata = _get_meta_cache().get(cache_key) if cache_key else None
+
+        if metadata:
+            # 文件未变化，直接使用缓存的元数据
+            for col, text in enumerate(metadata, start=1):
+                self.setItem(row, col, _centered_item(text))
+        else:
+            # 元数据先显示占位文本，提取完成后由_on_metadata_probed填充
+            for col in range(1, METADATA_COLUMN_COUNT + 1):
+                self.setItem(row, col, _centered_item("加载中..."))
+
+            task = ProbeTask(file_path, cache_key)
+            task.signals.probed.connect(self._on_metadata_probed)
+            self._probe_tasks[task.signals] = task
+            self._probe_pool.start(task)
+
+        # 文件大小（复用上面的stat结果）
+        if st is not None:
+            size_bytes = st.st_size
             if size_bytes < 1024 * 1024:
                 size_str = f"{size_bytes / 1024:.1f} KB"
             else:
                 size_str = f"{size_bytes / (1024 * 1024):.1f} MB"
-            self.setItem(row, 6, QTableWidgetItem(size_str))
-        except:
-            self.setItem(row, 6, QTableWidgetItem("未知"))
-
-        # 居中显示除文件路径外的所有列
-        for col in range(1, 7):
-            if self.item(row, col):
-                self.item(row, col).setTextAlignment(Qt.AlignCenter)
+            self.setItem(row, 6, _centered_item(size_str))
+        else:
+            self.setItem(row, 6, _centered_item("未知"))
 
         return row
 
+    def _on_metadata_probed(self, file_path, metadata):
+        """元数据提取完成（主线程），填充对应行"""
+        task = self._probe_tasks.pop(self.sender(), None)
+
+        # 提取成功的结果写入缓存（出错的不缓存，下次重试）
+        if task and task.cache_key and "错误" not in metadata:
+            _get_meta_cache()[task.cache_key] = metadata
+            self._meta_save_timer.start()
+
+        # 文件可能已从列表中删除
+        row = self._path_to_row.get(file_path)
+        if row is None:
+            return
+
+        for col, text in enumerate(metadata, start=1):
+            self.setItem(row, col, _centered_item(text))
+
+    @contextmanager
+    def batch_update(self):
+        """批量修改表格：期间暂停重绘、信号和按内容调整列宽，结束后统一计算一次"""
+        header = self.horizontalHeader()
+        sorting_enabled = self.isSortingEnabled()
+        self.setUpdatesEnabled(False)
+        self.blockSignals(True)
+        self.setSortingEnabled(False)
+        for col in range(1, self.columnCount()):
+            header.setSectionResizeMode(col, QHeaderView.Interactive)
+        try:
+            yield
+        finally:
+            for col in range(1, self.columnCount()):
+                header.setSectionResizeMode(col, QHeaderView.ResizeToContents)
+            # 恢复排序时会按当前排序列重新排序一次
+            self.setSortingEnabled(sorting_enabled)
+            self.blockSignals(False)
+            self.setUpdatesEnabled(True)
+            self.viewport().update()
+
+    def removeRow(self, row):
+        """删除行，同时维护路径索引"""
+        super().removeRow(row)
+        self._path_to_row = {
+            path: (r - 1 if r > row else r)
+            for path, r in self._path_to_row.items() if r != row
+        }
+
+    def setRowCount(self, rows):
+        """设置行数，同时维护路径索引"""
+        super().setRowCount(rows)
+        if len(self._path_to_row) > rows:
+            self._path_to_row = {path: r for path, r in self._path_to_row.items() if r < rows}
+
+    def get_file_row(self, file_path):
+        """获取文件所在的行号，不在列表中时返回None"""
+        return self._path_to_row.get(file_path)
+
     def get_selected_file_paths(self):
         """获取所有选中的文件路径"""
-        file_paths = []
-        for item in self.selectedItems():
-            if item.column() == 0:  # 只处理第一列的项目
-                file_path = item.data(Qt.UserRole)
-                file_paths.append(file_path)
-        return file_paths
+        # 按行选择，只需读取每个选中行第一列的数据
+        return [index.data(Qt.UserRole) for index in self.selectionModel().selectedRows(0)]
 
     def get_all_file_paths(self):
-        """获取所有文件路径"""
-        file_paths = []
-        for row in range(self.rowCount()):
-            item = self.item(row, 0)
-            if item:
-                file_path = item.data(Qt.UserRole)
-                file_paths.append(file_path)
-        return file_paths
+        """获取所有文件路径（按行顺序）"""
+        return list(self._path_to_row)
 
     def dragEnterEvent(self, event):
         """拖拽进入事件"""
         if event.mimeData().hasUrls():
-            # 检查是否有支持的音频文件
-            has_valid_file = False
-            for url in event.mimeData().urls():
-                file_path = url.toLocalFile()
-                if os.path.isfile(file_path):  # 首先确保是文件
-                    file_ext = os.path.splitext(file_path)[1].lower()
-                    if file_ext in SUPPORTED_AUDIO_EXTENSIONS:
-                        has_valid_file = True
-                        break
-
-            if has_valid_file:
+            # 检查是否有支持的音频文件，找到第一个即停止
+            # 只按扩展名判断，文件是否存在留到释放时再检查（进入事件会被频繁触发）
+            if any(url.toLocalFile().lower().endswith(SUPPORTED_AUDIO_EXTENSIONS)
+                   for url in event.mimeData().urls()):
                 event.accept()  # 显式接受事件
                 return
 
@@ -209,11 +360,9 @@ class AudioTableWidget(QTableWidget):
 
             for url in urls:
                 file_path = url.toLocalFile()
-                if os.path.isfile(file_path):  # 首先确保是文件
-                    file_ext = os.path.splitext(file_path)[1].lower()
-                    # 只处理支持的音频文件
-                    if file_ext in SUPPORTED_AUDIO_EXTENSIONS:
-                        files.append(file_path)
+                # 只处理支持的音频文件，先判断扩展名再确认是文件
+                if file_path.lower().endswith(SUPPORTED_AUDIO_EXTENSIONS) and os.path.isfile(file_path):
+                    files.append(file_path)
 
             if files:
                 self.files_dropped.emit(files)
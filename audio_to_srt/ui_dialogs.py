@@ -1,15 +1,126 @@
+import importlib.metadata
+import importlib.util
+from functools import lru_cache
+
 from PySide6.QtWidgets import (
-    QWidget, QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
+    QWidget, QDialog, QVBoxLayout, QHBoxLayout, QFormLayout, QLabel, QPushButton,
     QComboBox, QLineEdit, QTextEdit, QGroupBox, QRadioButton,
-    QListWidget, QListWidgetItem, QMessageBox, QTabWidget
+    QListView, QMessageBox, QTabWidget
+)
+from PySide6.QtCore import (
+    Qt, QTimer, QObject, QRunnable, QThreadPool, Signal,
+    QAbstractListModel, QModelIndex
 )
-from PySide6.QtCore import Qt
+from PySide6.QtGui import QFont
 
 from config_manager import (
-    get_proxy_details, save_proxy_settings,
-    get_api_keys, add_api_key, remove_api_key
+    get_proxy_details, save_all_proxy_settings,
+    get_api_keys, apply_key_changes
 )
 
+# 各服务固定的界面文本，模块加载时生成一次
+_SERVICE_META = {
+    "groq": {
+        "title": "Groq API密钥管理",
+        "prefix": "gsk_",
+        "placeholder": "输入Groq API密钥，gsk_开头",
+    },
+    "deepgram": {
+        "title": "Deepgram API密钥管理",
+        "prefix": "",
+        "placeholder": "输入Deepgram API密钥",
+    },
+}
+
+@lru_cache(maxsize=1024)
+def _mask_key(key):
+    """生成用于显示的密钥掩码文本"""
+    return f"{key[:5]}...{key[-4:]}" if len(key) > 10 else key
+
+
+# 代理服务器表单字段: (设置键, 标签, 占位文本, 是否为密码)
+_PROXY_FIELD_SPECS = (
+    ("host", "主机:", "例如: 127.0.0.1", False),
+    ("port", "端口:", "例如: 7890", False),
+    ("username", "用户名:", "可选", False),
+    ("password", "密码:", "可选", True),
+)
+
+# 依赖状态标签的文本和样式
+_STATUS_TEXTS = {True: "已安装", False: "未安装"}
+_STATUS_STYLES = {True: "color: green", False: "color: red"}
+
+# 依赖检查对话框的安装提示
+_DEPCHECK_HELP = (
+    "请使用以下命令安装缺失的依赖:\n\n"
+    "pip install groq  # Groq API客户端\n"
+    "pip install deepgram-sdk  # Deepgram API客户端\n"
+    "pip install httpx  # HTTP客户端\n"
+    "pip install httpx-socks  # SOCKS代理支持\n"
+)
+
+# 关于对话框的说明文本
+_ABOUT_DESCRIPTION = (
+    "这是一个基于AI的音频转文本/SRT工具，支持多种API服务和代理设置。\n\n"
+    "支持的服务:\n"
+    "- Groq Whisper API\n"
+    "- Deepgram API (开发中)\n\n"
+    "支持的功能:\n"
+    "- 多文件批处理\n"
+    "- SRT字幕和纯文本输出\n"
+    "- HTTP和SOCKS5代理支持\n"
+    "- 多语言支持"
+)
+
+# 关于对话框的标题字体（QFont需在QApplication创建后生成，因此首次使用时才创建）
+_about_title_font_cache = None
+
+
+def _about_title_font(base_font):
+    """获取关于对话框的标题字体"""
+    global _about_title_font_cache
+    if _about_title_font_cache is None:
+        font = QFont(base_font)
+        font.setPointSize(16)
+        font.setBold(True)
+        _about_title_font_cache = font
+    return _about_title_font_cache
+
+
+def _set_status(label, name, ok):
+    """设置依赖状态标签，值未变化时不调用setter（setStyleSheet会触发重新polish）"""
+    ok = bool(ok)
+    text = f"{name}: {_STATUS_TEXTS[ok]}"
+    if label.text() != text:
+        label.setText(text)
+
+    style = _STATUS_STYLES[ok]
+    if label.styleSheet() != style:
+        label.setStyleSheet(style)
+
+
+# 已创建的对话框，关闭后只是隐藏，再次打开时直接复用
+_DIALOG_POOL = {}
+
+
+def get_dialog(cls, parent=None, *args, on_create=None):
+    """获取对话框实例，同类型（及相同参数）只创建一次
+
+    参数:
+    - cls: 对话框类
+    - parent: 父窗口
+    - args: 传给对话框构造函数的其他参数（如APIKeyDialog的服务名称）
+    - on_create: 首次创建后调用的函数，用于连接信号(可选)
+    """
+    key = (cls, parent, *args)
+    dialog = _DIALOG_POOL.get(key)
+    if dialog is None:
+        dialog = cls(parent, *args)
+        _DIALOG_POOL[key] = dialog
+        if on_create is not None:
+            on_create(dialog)
+    return dialog
+
 
 class ProxySettingsDialog(QDialog):
     """代理设置对话框"""
@@ -24,12 +135,18 @@ class ProxySettingsDialog(QDialog):
         layout = QVBoxLayout(self)
 
         # 使用选项卡分别设置不同服务的代理
+        # 选项卡内容在首次切换到该页时才创建，这里只放空白占位页
         self.tab_widget = QTabWidget()
-        self.groq_tab = self.create_proxy_tab("groq")
-        self.deepgram_tab = self.create_proxy_tab("deepgram")
+        self.groq_tab = QWidget()
+        self.deepgram_tab = QWidget()
+        self._service_of_index = {0: "groq", 1: "deepgram"}
+        self._tab_built = {0: False, 1: False}
+        # 已构建选项卡的控件，按服务名称保存，每次打开对话框时从配置重新填充
+        self._proxy_widgets = {}
 
         self.tab_widget.addTab(self.groq_tab, "Groq代理")
         self.tab_widget.addTab(self.deepgram_tab, "Deepgram代理")
+        self.tab_widget.currentChanged.connect(self._ensure_tab_built)
 
         layout.addWidget(self.tab_widget)
 
@@ -43,6 +160,26 @@ class ProxySettingsDialog(QDialog):
 
         layout.addLayout(button_layout)
 
+        # 只构建初始可见的选项卡
+        self._ensure_tab_built(0)
+
+    def showEvent(self, event):
+        """每次打开时从配置重新加载已构建的选项卡，丢弃上次未保存的修改"""
+        for service_name in self._proxy_widgets:
+            self._load_proxy_tab(service_name)
+        super().showEvent(event)
+
+    def _ensure_tab_built(self, index):
+        """首次显示某个选项卡时再创建其内容"""
+        if self._tab_built.get(index, True):
+            return
+        self._tab_built[index] = True
+
+        placeholder = self.tab_widget.widget(index)
+        placeholder_layout = QVBoxLayout(placeholder)
+        placeholder_layout.setContentsMargins(0, 0, 0, 0)
+        placeholder_layout.addWidget(self.create_proxy_tab(self._service_of_index[index]))
+
     def create_proxy_tab(self, service_name):
         """创建代理设置选项卡
 
@@ -52,15 +189,6 @@ class ProxySettingsDialog(QDialog):
         tab = QWidget()
         layout = QVBoxLayout(tab)
 
-        # 加载当前设置
-        settings = get_proxy_details(service_name)
-        enabled = settings.get("enabled", "False").lower() == "true"
-        proxy_type = settings.get("type", "http")
-        host = settings.get("host", "")
-        port = settings.get("port", "")
-        username = settings.get("username", "")
-        password = settings.get("password", "")
-
         # 代理设置表单
         form_layout = QVBoxLayout()
 
@@ -72,13 +200,6 @@ class ProxySettingsDialog(QDialog):
         http_proxy_radio = QRadioButton("HTTP代理")
         socks5_proxy_radio = QRadioButton("SOCKS5代理")
 
-        if not enabled:
-            no_proxy_radio.setChecked(True)
-        elif proxy_type == "socks5":
-            socks5_proxy_radio.setChecked(True)
-        else:
-            http_proxy_radio.setChecked(True)
-
         proxy_type_layout.addWidget(no_proxy_radio)
         proxy_type_layout.addWidget(http_proxy_radio)
         proxy_type_layout.addWidget(socks5_proxy_radio)
@@ -88,44 +209,17 @@ class ProxySettingsDialog(QDialog):
 
         # 代理设置
         proxy_settings_group = QGroupBox("代理服务器")
-        proxy_settings_layout = QVBoxLayout()
-
-        # 主机和端口
-        host_port_layout = QHBoxLayout()
-
-        host_label = QLabel("主机:")
-        host_input = QLineEdit(host)
-        host_input.setPlaceholderText("例如: 127.0.0.1")
-
-        port_label = QLabel("端口:")
-        port_input = QLineEdit(port)
-        port_input.setPlaceholderText("例如: 7890")
-
-        host_port_layout.addWidget(host_label)
-        host_port_layout.addWidget(host_input, 3)
-        host_port_layout.addWidget(port_label)
-        host_port_layout.addWidget(port_input, 1)
-
-        proxy_settings_layout.addLayout(host_port_layout)
-
-        # 用户名密码（可选）
-        auth_layout = QHBoxLayout()
-
-        username_label = QLabel("用户名:")
-        username_input = QLineEdit(username)
-        username_input.setPlaceholderText("可选")
-
-        password_label = QLabel("密码:")
-        password_input = QLineEdit(password)
-        password_input.setPlaceholderText("可选")
-        password_input.setEchoMode(QLineEdit.Password)
-
-        auth_layout.addWidget(username_label)
-        auth_layout.addWidget(username_input)
-        auth_layout.addWidget(password_label)
-        auth_layout.addWidget(password_input)
-
-        proxy_settings_layout.addLayout(auth_layout)
+        proxy_settings_layout = QFormLayout()
+
+        # 主机、端口、用户名、密码（用户名密码可选）
+        inputs = {}
+        for key, label, placeholder, is_password in _PROXY_FIELD_SPECS:
+            edit = QLineEdit()
+            edit.setPlaceholderText(placeholder)
+            if is_password:
+                edit.setEchoMode(QLineEdit.Password)
+            proxy_settings_layout.addRow(label, edit)
+            inputs[key] = edit
 
         proxy_settings_group.setLayout(proxy_settings_layout)
         form_layout.addWidget(proxy_settings_group)
@@ -154,57 +248,158 @@ class ProxySettingsDialog(QDialog):
         # 保存设置
         def save_settings():
             settings = {
-                "enabled": str(not no_proxy_radio.isChecked()),
+                "enabled": not no_proxy_radio.isChecked(),
                 "type": "socks5" if socks5_proxy_radio.isChecked() else "http",
-                "host": host_input.text().strip(),
-                "port": port_input.text().strip(),
-                "username": username_input.text().strip(),
-                "password": password_input.text()
+                "host": inputs["host"].text().strip(),
+                "port": inputs["port"].text().strip(),
+                "username": inputs["username"].text().strip(),
+                "password": inputs["password"].text()
             }
 
             # 验证设置
-            if settings["enabled"].lower() == "true":
-                if not settings["host"]:
-                    QMessageBox.warning(self, "错误", "请输入代理主机地址")
-                    return
-
-                if not settings["port"]:
-                    QMessageBox.warning(self, "错误", "请输入代理端口")
-                    return
+            if settings["enabled"] and not (settings["host"] and settings["port"]):
+                QMessageBox.warning(self, "错误", "请输入代理主机地址和端口")
+                return
 
             # 保存设置
-            save_proxy_settings(settings, service_name)
+            save_all_proxy_settings({service_name: settings})
             QMessageBox.information(self, "成功", f"{service_name.capitalize()}代理设置已保存")
 
         save_btn.clicked.connect(save_settings)
 
-        # 初始化UI状态
-        update_ui_state()
+        # 从配置填充控件并初始化UI状态
+        self._proxy_widgets[service_name] = (
+            no_proxy_radio, http_proxy_radio, socks5_proxy_radio, proxy_settings_group, inputs
+        )
+        self._load_proxy_tab(service_name)
 
         return tab
 
+    def _load_proxy_tab(self, service_name):
+        """从配置加载代理设置到选项卡控件
+
+        参数:
+        - service_name: 服务名称("groq"或"deepgram")
+        """
+        no_proxy_radio, http_proxy_radio, socks5_proxy_radio, proxy_settings_group, inputs = \
+            self._proxy_widgets[service_name]
+
+        settings = get_proxy_details(service_name)
+        enabled = settings.get("enabled", False)
+        proxy_type = settings.get("type", "http")
+
+        if not enabled:
+            no_proxy_radio.setChecked(True)
+        elif proxy_type == "socks5":
+            socks5_proxy_radio.setChecked(True)
+        else:
+            http_proxy_radio.setChecked(True)
+
+        for key, edit in inputs.items():
+            edit.setText(settings.get(key, ""))
+
+        proxy_settings_group.setEnabled(enabled)
+
+
+class _KeyListModel(QAbstractListModel):
+    """API密钥列表模型，每行保存(名称, 密钥)，显示文本在data()中按需生成"""
+
+    def __init__(self, keys, parent=None):
+        super().__init__(parent)
+        self._rows = list(keys.items())
+        # 密钥名称 -> 行号，增删时同步维护
+        self._row_index = {name: row for row, (name, _) in enumerate(self._rows)}
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+
+        name, key = self._rows[index.row()]
+        if role == Qt.DisplayRole:
+            masked_key = _mask_key(key)
+            return f"{name}: {masked_key}" if name != key else masked_key
+        if role == Qt.UserRole:
+            return name, key
+        return None
+
+    def add(self, name, key):
+        """添加密钥，同名密钥被覆盖时原地更新"""
+        row = self._row_index.get(name)
+        if row is not None:
+            self._rows[row] = (name, key)
+            index = self.index(row)
+            self.dataChanged.emit(index, index)
+            return
+
+        row = len(self._rows)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._rows.append((name, key))
+        self._row_index[name] = row
+        self.endInsertRows()
+
+    def remove(self, name):
+        """删除密钥"""
+        row = self._row_index.get(name)
+        if row is None:
+            return
+
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._rows[row]
+        del self._row_index[name]
+        # 后面各行前移一行
+        for later_row, (later_name, _) in enumerate(self._rows[row:], start=row):
+            self._row_index[later_name] = later_row
+        self.endRemoveRows()
+
 
 class APIKeyDialog(QDialog):
     """API密钥管理对话框"""
 
+    keys_changed = Signal(str)  # 密钥已写入配置文件，参数为服务名称
+
     def __init__(self, parent=None, service="groq"):
         super().__init__(parent)
-        self.parent_window = parent
         self.service = service
 
-        title_text = "Groq API密钥管理" if service == "groq" else "Deepgram API密钥管理"
-        self.setWindowTitle(title_text)
+        self._meta = _SERVICE_META.get(service, _SERVICE_META["groq"])
+        self.setWindowTitle(self._meta["title"])
         self.setMinimumSize(550, 350)
 
+        # 对话框内的密钥缓存，增删先记录下来，再合并写入配置文件
+        self._keys = dict(get_api_keys(service))
+        self._pending_adds = {}
+        self._pending_removes = set()
+
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(250)
+        self._flush_timer.timeout.connect(self._flush)
+
+        # 控件在首次显示时才创建
+        self._built = False
+
+    def showEvent(self, event):
+        """首次显示时构建界面"""
+        if not self._built:
+            self._built = True
+            self._build_ui()
+            self.adjustSize()
+        super().showEvent(event)
+
+    def _build_ui(self):
+        """创建对话框控件"""
         layout = QVBoxLayout(self)
 
         # 顶部说明
-        info_label = QLabel(title_text)
+        info_label = QLabel(self._meta["title"])
         info_label.setAlignment(Qt.AlignCenter)
         layout.addWidget(info_label)
 
         # 密钥列表
-        self.key_list = QListWidget()
+        self.key_list = QListView()
         layout.addWidget(self.key_list)
 
         # 新建密钥表单
@@ -221,9 +416,7 @@ class APIKeyDialog(QDialog):
         key_layout = QHBoxLayout()
         key_label = QLabel("密钥:")
         self.key_value_input = QLineEdit()
-
-        key_prefix = "gsk_" if service == "groq" else ""
-        self.key_value_input.setPlaceholderText(f"输入{title_text}，{key_prefix}开头")
+        self.key_value_input.setPlaceholderText(self._meta["placeholder"])
 
         key_layout.addWidget(key_label)
         key_layout.addWidget(self.key_value_input)
@@ -252,23 +445,30 @@ class APIKeyDialog(QDialog):
 
         layout.addLayout(button_layout)
 
-        # 初始化完所有控件后再刷新密钥列表
-        self.refresh_keys()
+        # 初始化完所有控件后再填充密钥列表
+        self._populate_initial()
+
+    def _populate_initial(self):
+        """首次填充密钥列表"""
+        self._model = _KeyListModel(self._keys, self)
+        self.key_list.setModel(self._model)
+        self.remove_btn.setEnabled(self._model.rowCount() > 0)
+
+    def _apply_delta(self, added, removed):
+        """只增删发生变化的行，避免整表重建
 
-    def refresh_keys(self):
-        """刷新密钥列表"""
-        self.key_list.clear()
-        keys = get_api_keys(self.service)
+        参数:
+        - added: 新增或更新的(名称, 密钥)序列
+        - removed: 删除的密钥名称序列
+        """
+        for name in removed:
+            self._model.remove(name)
 
-        for name, key in keys.items():
-            masked_key = f"{key[:5]}...{key[-4:]}" if len(key) > 10 else key
-            item_text = f"{name}: {masked_key}" if name != key else masked_key
-            item = QListWidgetItem(item_text)
-            item.setData(Qt.UserRole, (name, key))
-            self.key_list.addItem(item)
+        for name, key in added:
+            self._model.add(name, key)
 
         # 更新删除按钮状态
-        self.remove_btn.setEnabled(self.key_list.count() > 0)
+        self.remove_btn.setEnabled(self._model.rowCount() > 0)
 
     def add_key(self):
         """添加新密钥"""
@@ -279,7 +479,7 @@ class APIKeyDialog(QDialog):
             QMessageBox.warning(self, "错误", "请输入API密钥")
             return
 
-        key_prefix = "gsk_" if self.service == "groq" else ""
+        key_prefix = self._meta["prefix"]
         if key_prefix and not key.startswith(key_prefix):
             QMessageBox.warning(self, "错误", f"{self.service.capitalize()} API密钥通常以{key_prefix}开头")
             return
@@ -289,27 +489,25 @@ class APIKeyDialog(QDialog):
             name = key
 
         # 添加密钥
-        add_api_key(name, key, self.service)
+        self._keys[name] = key
+        self._pending_removes.discard(name)
+        self._pending_adds[name] = key
+        self._flush_timer.start()
 
         # 清空输入框
         self.key_name_input.clear()
         self.key_value_input.clear()
 
-        # 刷新列表
-        self.refresh_keys()
-
-        # 同时刷新主窗口的密钥列表
-        if self.parent_window and hasattr(self.parent_window, 'load_api_keys'):
-            self.parent_window.load_api_keys()
+        # 更新列表
+        self._apply_delta([(name, key)], ())
 
     def remove_key(self):
         """删除所选密钥"""
-        selected_items = self.key_list.selectedItems()
-        if not selected_items:
+        index = self.key_list.selectionModel().currentIndex()
+        if not index.isValid() or not self.key_list.selectionModel().isSelected(index):
             return
 
-        item = selected_items[0]
-        name, _ = item.data(Qt.UserRole)
+        name, _ = index.data(Qt.UserRole)
 
         # 确认删除
         reply = QMessageBox.question(
@@ -321,12 +519,100 @@ class APIKeyDialog(QDialog):
         )
 
         if reply == QMessageBox.Yes:
-            remove_api_key(name, self.service)
-            self.refresh_keys()
+            self._keys.pop(name, None)
+            self._pending_adds.pop(name, None)
+            self._pending_removes.add(name)
+            self._flush_timer.start()
+            self._apply_delta((), [name])
+
+    def _flush(self):
+        """将累积的密钥增删一次性写入配置文件"""
+        self._flush_timer.stop()
+        if not self._pending_adds and not self._pending_removes:
+            return
 
-            # 同时刷新主窗口的密钥列表
-            if self.parent_window and hasattr(self.parent_window, 'load_api_keys'):
-                self.parent_window.load_api_keys()
+        apply_key_changes(self.service, self._pending_adds, self._pending_removes)
+        self._pending_adds = {}
+        self._pending_removes = set()
+
+        # 通知主窗口刷新密钥列表（每次合并写入只通知一次）
+        self.keys_changed.emit(self.service)
+
+    def done(self, result):
+        """关闭对话框前写回未保存的密钥修改"""
+        self._flush()
+        super().done(result)
+
+
+# 依赖检查结果缓存，各SDK的导入只需进行一次
+_diag_cache = None
+
+# 依赖状态标签对应的模块（顺序与状态元组一致）
+_DEPENDENCY_MODULES = ("groq", "deepgram", "httpx", "httpx_socks")
+
+
+def _collect_diagnostics():
+    """收集依赖状态和详细信息（在工作线程中执行）
+
+    返回:
+    - {"status": (groq, deepgram, httpx, httpx_socks) 或 None, "details": [文本行]}
+    """
+    details = []
+
+    try:
+        # 尝试获取诊断信息
+        from api_clients import get_diagnostics
+        diagnostics = get_diagnostics()
+
+        # 添加诊断信息到详细区域
+        if 'debug_info' in diagnostics:
+            details.append("=== 详细诊断信息 ===\n")
+            details.extend(diagnostics['debug_info'])
+
+        status = (
+            diagnostics.get('groq_available', False),
+            diagnostics.get('deepgram_available', False),
+            diagnostics.get('httpx_available', False),
+            diagnostics.get('socks_available', False),
+        )
+
+    except ImportError:
+        # 如果没有get_diagnostics函数，只查找模块规格判断是否安装（不执行模块代码）
+        specs = [importlib.util.find_spec(name) for name in _DEPENDENCY_MODULES]
+        status = tuple(spec is not None for spec in specs)
+
+        groq_spec = specs[0]
+        if groq_spec is not None:
+            try:
+                groq_version = importlib.metadata.version("groq")
+            except importlib.metadata.PackageNotFoundError:
+                groq_version = '未知'
+            details.append(f"Groq SDK版本: {groq_version}")
+            details.append(f"Groq SDK位置: {groq_spec.origin or '未知'}")
+        else:
+            details.append("Groq SDK未安装")
+
+    except Exception as e:
+        status = None
+        details.append(f"检查依赖时出错: {str(e)}")
+
+    return {"status": status, "details": details}
+
+
+class DiagnosticsSignals(QObject):
+    """依赖检查任务的信号（QRunnable本身不能定义信号）"""
+    finished = Signal(dict)
+
+
+class DiagnosticsTask(QRunnable):
+    """在线程池中检查依赖"""
+
+    def __init__(self):
+        super().__init__()
+        self.signals = DiagnosticsSignals()
+
+    def run(self):
+        self.signals.finished.emit(_collect_diagnostics())
 
 
 class DependencyCheckerDialog(QDialog):
@@ -337,6 +623,20 @@ class DependencyCheckerDialog(QDialog):
         self.setWindowTitle("依赖检查")
         self.setMinimumWidth(500)
 
+        # 控件和依赖检查都推迟到首次显示
+        self._built = False
+        self._diag_task = None
+
+    def showEvent(self, event):
+        """首次显示时构建界面并检查依赖"""
+        if not self._built:
+            self._built = True
+            self._build_ui()
+            self.adjustSize()
+        super().showEvent(event)
+
+    def _build_ui(self):
+        """创建对话框控件"""
         layout = QVBoxLayout(self)
 
         # 依赖状态显示
@@ -363,20 +663,14 @@ class DependencyCheckerDialog(QDialog):
         layout.addWidget(self.details_text)
 
         # 安装提示
-        help_text = QLabel(
-            "请使用以下命令安装缺失的依赖:\n\n"
-            "pip install groq  # Groq API客户端\n"
-            "pip install deepgram-sdk  # Deepgram API客户端\n"
-            "pip install httpx  # HTTP客户端\n"
-            "pip install httpx-socks  # SOCKS代理支持\n"
-        )
+        help_text = QLabel(_DEPCHECK_HELP)
         help_text.setWordWrap(True)
         layout.addWidget(help_text)
 
         # 按钮
         button_layout = QHBoxLayout()
         self.check_btn = QPushButton("重新检查")
-        self.check_btn.clicked.connect(self.check_dependencies)
+        self.check_btn.clicked.connect(self.recheck_dependencies)
 
         self.close_btn = QPushButton("关闭")
         self.close_btn.clicked.connect(self.accept)
@@ -389,77 +683,68 @@ class DependencyCheckerDialog(QDialog):
         # 检查依赖
         self.check_dependencies()
 
-    def check_dependencies(self):
-        """检查依赖"""
-        self.details_text.clear()
+    def recheck_dependencies(self):
+        """重新检查依赖（忽略缓存的结果）"""
+        self.check_dependencies(force=True)
 
-        try:
-            # 尝试获取诊断信息
-            from api_clients import get_diagnostics
-            diagnostics = get_diagnostics()
-
-            # 添加诊断信息到详细区域
-            if 'debug_info' in diagnostics:
-                self.details_text.append("=== 详细诊断信息 ===\n")
-                for line in diagnostics['debug_info']:
-                    self.details_text.append(line)
-
-            # 更新状态标签
-            groq_available = diagnostics.get('groq_available', False)
-            self.groq_status.setText(f"Groq SDK: {'已安装' if groq_available else '未安装'}")
-            self.groq_status.setStyleSheet("color: green" if groq_available else "color: red")
-
-            deepgram_available = diagnostics.get('deepgram_available', False)
-            self.deepgram_status.setText(f"Deepgram SDK: {'已安装' if deepgram_available else '未安装'}")
-            self.deepgram_status.setStyleSheet("color: green" if deepgram_available else "color: red")
-
-            httpx_available = diagnostics.get('httpx_available', False)
-            self.httpx_status.setText(f"HTTPX: {'已安装' if httpx_available else '未安装'}")
-            self.httpx_status.setStyleSheet("color: green" if httpx_available else "color: red")
-
-            socks_available = diagnostics.get('socks_available', False)
-            self.httpx_socks_status.setText(f"HTTPX-SOCKS: {'已安装' if socks_available else '未安装'}")
-            self.httpx_socks_status.setStyleSheet("color: green" if socks_available else "color: red")
-
-        except ImportError:
-            # 如果没有get_diagnostics函数，使用传统方法检查
-            try:
-                import groq
-                self.groq_status.setText("Groq SDK: 已安装")
-                self.groq_status.setStyleSheet("color: green")
-                self.details_text.append(f"Groq SDK版本: {getattr(groq, '__version__', '未知')}")
-                self.details_text.append(f"Groq SDK位置: {getattr(groq, '__file__', '未知')}")
-            except ImportError:
-                self.groq_status.setText("Groq SDK: 未安装")
-                self.groq_status.setStyleSheet("color: red")
-                self.details_text.append("Groq SDK未安装")
+    def check_dependencies(self, force=False):
+        """检查依赖
 
-            try:
-                import deepgram
-                self.deepgram_status.setText("Deepgram SDK: 已安装")
-                self.deepgram_status.setStyleSheet("color: green")
-            except ImportError:
-                self.deepgram_status.setText("Deepgram SDK: 未安装")
-                self.deepgram_status.setStyleSheet("color: red")
+        检查在线程池中进行，避免导入各SDK时阻塞界面；
+        结果在模块级缓存，再次打开对话框时直接使用。
+        """
+        if _diag_cache is not None and not force:
+            self._apply_diagnostics(_diag_cache)
+            return
 
-            try:
-                import httpx
-                self.httpx_status.setText("HTTPX: 已安装")
-                self.httpx_status.setStyleSheet("color: green")
-            except ImportError:
-                self.httpx_status.setText("HTTPX: 未安装")
-                self.httpx_status.setStyleSheet("color: red")
+        if self._diag_task is not None:
+            return
 
-            try:
-                import httpx_socks
-                self.httpx_socks_status.setText("HTTPX-SOCKS: 已安装")
-                self.httpx_socks_status.setStyleSheet("color: green")
-            except ImportError:
-                self.httpx_socks_status.setText("HTTPX-SOCKS: 未安装")
-                self.httpx_socks_status.setStyleSheet("color: red")
+        self.check_btn.setEnabled(False)
+        self.details_text.clear()
+        for label, name in self._status_labels():
+            label.setText(f"{name}: 正在检查...")
+
+        task = DiagnosticsTask()
+        task.signals.finished.connect(self._on_diagnostics_finished)
+        self._diag_task = task
+        QThreadPool.globalInstance().start(task)
+
+    def _on_diagnostics_finished(self, result):
+        """依赖检查完成（在GUI线程中执行）"""
+        global _diag_cache
+        _diag_cache = result
+        self._diag_task = None
+        self.check_btn.setEnabled(True)
+        self._apply_diagnostics(result)
+
+    def _status_labels(self):
+        """依赖状态标签及其显示名称"""
+        return (
+            (self.groq_status, "Groq SDK"),
+            (self.deepgram_status, "Deepgram SDK"),
+            (self.httpx_status, "HTTPX"),
+            (self.httpx_socks_status, "HTTPX-SOCKS"),
+        )
+
+    def _apply_diagnostics(self, result):
+        """将检查结果显示到界面"""
+        self.details_text.clear()
+        for line in result["details"]:
+            self.details_text.append(line)
 
-        except Exception as e:
-            self.details_text.append(f"检查依赖时出错: {str(e)}")
+        # 检查出错时状态未知，保持标签不变
+        status = result["status"]
+        if status is None:
+            return
+
+        # 四个标签更新完后只重绘一次
+        self.setUpdatesEnabled(False)
+        try:
+            for (label, name), ok in zip(self._status_labels(), status):
+                _set_status(label, name, ok)
+        finally:
+            self.setUpdatesEnabled(True)
 
 
 class AboutDialog(QDialog):
@@ -471,15 +756,25 @@ class AboutDialog(QDialog):
         self.setMinimumWidth(400)
         self.setMinimumHeight(300)
 
+        # 控件在首次显示时才创建
+        self._built = False
+
+    def showEvent(self, event):
+        """首次显示时构建界面"""
+        if not self._built:
+            self._built = True
+            self._build_ui()
+            self.adjustSize()
+        super().showEvent(event)
+
+    def _build_ui(self):
+        """创建对话框控件"""
         layout = QVBoxLayout(self)
 
         # 应用名称
         app_name = QLabel("音频转文本/SRT工具")
         app_name.setAlignment(Qt.AlignCenter)
-        font = app_name.font()
-        font.setPointSize(16)
-        font.setBold(True)
-        app_name.setFont(font)
+        app_name.setFont(_about_title_font(app_name.font()))
         layout.addWidget(app_name)
 
         # 版本信息
@@ -488,17 +783,7 @@ class AboutDialog(QDialog):
         layout.addWidget(version)
 
         # 说明
-        description = QLabel(
-            "这是一个基于AI的音频转文本/SRT工具，支持多种API服务和代理设置。\n\n"
-            "支持的服务:\n"
-            "- Groq Whisper API\n"
-            "- Deepgram API (开发中)\n\n"
-            "支持的功能:\n"
-            "- 多文件批处理\n"
-            "- SRT字幕和纯文本输出\n"
-            "- HTTP和SOCKS5代理支持\n"
-            "- 多语言支持"
-        )
+        description = QLabel(_ABOUT_DESCRIPTION)
         description.setWordWrap(True)
         description.setAlignment(Qt.AlignCenter)
         layout.addWidget(description)
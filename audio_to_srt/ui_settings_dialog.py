@@ -5,6 +5,7 @@ from PySide6.QtWidgets import (
     QSlider
 )
 from PySide6.QtCore import Qt, Signal
+from contextlib import contextmanager
 import json
 
 from config_manager import (
@@ -12,6 +13,27 @@ from config_manager import (
 )
 
 
+def _fill_combo(combo, items):
+    """一次性填充下拉框（先批量添加文本再设置数据，避免逐项触发信号）
+
+    参数:
+    - combo: 下拉框
+    - items: (显示文本, 数据)列表
+
+    返回:
+    - {数据: 索引}，用于代替findData的线性查找
+    """
+    combo.blockSignals(True)
+    try:
+        combo.addItems([text for text, _ in items])
+        for index, (_, data) in enumerate(items):
+            combo.setItemData(index, data)
+    finally:
+        combo.blockSignals(False)
+
+    return {data: index for index, (_, data) in enumerate(items)}
+
+
 class ConversionSettingsDialog(QDialog):
     """转换设置对话框"""
     settings_changed = Signal()  # 设置变更信号
@@ -31,12 +53,15 @@ class ConversionSettingsDialog(QDialog):
         layout = QVBoxLayout(self)
 
         # 创建标签页控件
+        # 选项卡内容在首次显示该页时才创建，这里只放空白占位页
         self.tab_widget = QTabWidget()
-        self.groq_tab = self.create_groq_tab()
-        self.deepgram_tab = self.create_deepgram_tab()
+        self.groq_tab = QWidget()
+        self.deepgram_tab = QWidget()
+        self._tab_built = {0: False, 1: False}
 
         self.tab_widget.addTab(self.groq_tab, "Groq设置")
         self.tab_widget.addTab(self.deepgram_tab, "Deepgram设置")
+        self.tab_widget.currentChanged.connect(self._ensure_tab_built)
 
         layout.addWidget(self.tab_widget)
 
@@ -54,6 +79,29 @@ class ConversionSettingsDialog(QDialog):
 
         layout.addLayout(button_layout)
 
+    def showEvent(self, event):
+        """显示时确保当前选项卡已创建（set_service可能已切换了选项卡）"""
+        self._ensure_tab_built(self.tab_widget.currentIndex())
+        super().showEvent(event)
+
+    def _ensure_tab_built(self, index):
+        """首次显示某个选项卡时再创建其内容并加载对应设置"""
+        if self._tab_built.get(index, True):
+            return
+        self._tab_built[index] = True
+
+        if index == 0:
+            content = self.create_groq_tab()
+            self._load_groq_settings(self._settings.get("groq", {}))
+        else:
+            content = self.create_deepgram_tab()
+            self._load_deepgram_settings(self._settings.get("deepgram", {}))
+
+        placeholder = self.tab_widget.widget(index)
+        placeholder_layout = QVBoxLayout(placeholder)
+        placeholder_layout.setContentsMargins(0, 0, 0, 0)
+        placeholder_layout.addWidget(content)
+
     def create_groq_tab(self):
         """创建Groq设置选项卡"""
         tab = QWidget()
@@ -65,8 +113,10 @@ class ConversionSettingsDialog(QDialog):
 
         model_form = QFormLayout()
         self.groq_model_combo = QComboBox()
-        self.groq_model_combo.addItem("whisper-large-v3", "whisper-large-v3")
-        self.groq_model_combo.addItem("whisper-medium", "whisper-medium")
+        self._groq_model_index = _fill_combo(self.groq_model_combo, [
+            ("whisper-large-v3", "whisper-large-v3"),
+            ("whisper-medium", "whisper-medium"),
+        ])
 
         model_form.addRow("转写模型:", self.groq_model_combo)
         model_layout.addLayout(model_form)
@@ -88,8 +138,10 @@ class ConversionSettingsDialog(QDialog):
 
         # 时间戳精度
         self.groq_timestamps_combo = QComboBox()
-        self.groq_timestamps_combo.addItem("标准精度", "granular")
-        self.groq_timestamps_combo.addItem("高精度", "word")
+        self._groq_timestamps_index = _fill_combo(self.groq_timestamps_combo, [
+            ("标准精度", "granular"),
+            ("高精度", "word"),
+        ])
         advanced_layout.addRow("时间戳精度:", self.groq_timestamps_combo)
 
         # 检测语言
@@ -123,6 +175,14 @@ class ConversionSettingsDialog(QDialog):
         advanced_group.setLayout(advanced_layout)
         layout.addWidget(advanced_group)
 
+        # 加载设置时需要批量更新的输入控件
+        self._groq_inputs = (
+            self.groq_model_combo, self.groq_timestamps_combo,
+            self.groq_detect_lang_check, self.groq_translate_check,
+            self.groq_temperature_spin, self.groq_max_line_count,
+            self.groq_max_line_width,
+        )
+
         layout.addStretch()
         return tab
 
@@ -136,15 +196,19 @@ class ConversionSettingsDialog(QDialog):
         model_layout = QFormLayout()
 
         self.dg_model_combo = QComboBox()
-        self.dg_model_combo.addItem("nova-2", "nova-2")
-        self.dg_model_combo.addItem("nova", "nova")
-        self.dg_model_combo.addItem("enhanced", "enhanced")
+        self._dg_model_index = _fill_combo(self.dg_model_combo, [
+            ("nova-2", "nova-2"),
+            ("nova", "nova"),
+            ("enhanced", "enhanced"),
+        ])
         model_layout.addRow("转写模型:", self.dg_model_combo)
 
         # 模型版本
         self.dg_version_combo = QComboBox()
-        self.dg_version_combo.addItem("最新版本", "latest")
-        self.dg_version_combo.addItem("特定版本", "")
+        _fill_combo(self.dg_version_combo, [
+            ("最新版本", "latest"),
+            ("特定版本", ""),
+        ])
         model_layout.addRow("模型版本:", self.dg_version_combo)
 
         # 版本输入框
@@ -204,17 +268,21 @@ class ConversionSettingsDialog(QDialog):
 
         # 处理精度
         self.dg_tier_combo = QComboBox()
-        self.dg_tier_combo.addItem("标准", "base")
-        self.dg_tier_combo.addItem("增强", "enhanced")
+        self._dg_tier_index = _fill_combo(self.dg_tier_combo, [
+            ("标准", "base"),
+            ("增强", "enhanced"),
+        ])
         performance_layout.addRow("处理精度:", self.dg_tier_combo)
 
         # 音频采样率
         self.dg_sample_rate_combo = QComboBox()
-        self.dg_sample_rate_combo.addItem("自动", "")
-        self.dg_sample_rate_combo.addItem("8 kHz", "8000")
-        self.dg_sample_rate_combo.addItem("16 kHz", "16000")
-        self.dg_sample_rate_combo.addItem("44.1 kHz", "44100")
-        self.dg_sample_rate_combo.addItem("48 kHz", "48000")
+        self._dg_sample_rate_index = _fill_combo(self.dg_sample_rate_combo, [
+            ("自动", ""),
+            ("8 kHz", "8000"),
+            ("16 kHz", "16000"),
+            ("44.1 kHz", "44100"),
+            ("48 kHz", "48000"),
+        ])
         performance_layout.addRow("音频采样率:", self.dg_sample_rate_combo)
 
         performance_group.setLayout(performance_layout)
@@ -226,8 +294,10 @@ class ConversionSettingsDialog(QDialog):
 
         # 时间戳精度
         self.dg_timestamps_combo = QComboBox()
-        self.dg_timestamps_combo.addItem("单词级", "word")
-        self.dg_timestamps_combo.addItem("句子级", "sentence")
+        self._dg_timestamps_index = _fill_combo(self.dg_timestamps_combo, [
+            ("单词级", "word"),
+            ("句子级", "sentence"),
+        ])
         output_layout.addRow("时间戳精度:", self.dg_timestamps_combo)
 
         # 置信度阈值
@@ -249,9 +319,38 @@ class ConversionSettingsDialog(QDialog):
         advanced_group.setLayout(advanced_layout)
         layout.addWidget(advanced_group)
 
+        # 加载设置时需要批量更新的输入控件
+        self._dg_inputs = (
+            self.dg_model_combo, self.dg_version_combo, self.dg_version_input,
+            self.dg_smart_format_check, self.dg_punctuate_check,
+            self.dg_diarize_check, self.dg_detect_language_check,
+            self.dg_multichannel_check, self.dg_keywords_input,
+            self.dg_tier_combo, self.dg_sample_rate_combo,
+            self.dg_timestamps_combo, self.dg_confidence_slider,
+            self.dg_confidence_label,
+        )
+
         layout.addStretch()
         return tab
 
+    @contextmanager
+    def _bulk_load(self, widgets):
+        """批量设置控件值：期间屏蔽控件信号并暂停重绘，结束后统一刷新一次
+
+        屏蔽信号后联动逻辑（如版本输入框启用状态、置信度标签）不会触发，
+        加载代码需要自行设置这些状态
+        """
+        self.setUpdatesEnabled(False)
+        for widget in widgets:
+            widget.blockSignals(True)
+        try:
+            yield
+        finally:
+            for widget in widgets:
+                widget.blockSignals(False)
+            self.setUpdatesEnabled(True)
+            self.update()
+
     def set_service(self, service):
         """设置当前服务"""
         self.current_service = service
@@ -263,135 +362,145 @@ class ConversionSettingsDialog(QDialog):
     def load_settings(self):
         """加载设置"""
         settings = get_conversion_settings()
-
-        # Groq设置
-        groq_settings = settings.get("groq", {})
-
-        # 模型
-        model = groq_settings.get("model", "whisper-large-v3")
-        index = self.groq_model_combo.findData(model)
-        if index >= 0:
-            self.groq_model_combo.setCurrentIndex(index)
-
-        # 时间戳
-        timestamps = groq_settings.get("timestamps", "granular")
-        index = self.groq_timestamps_combo.findData(timestamps)
-        if index >= 0:
-            self.groq_timestamps_combo.setCurrentIndex(index)
-
-        # 检测语言
-        self.groq_detect_lang_check.setChecked(groq_settings.get("detect_language", True))
-
-        # 翻译
-        self.groq_translate_check.setChecked(groq_settings.get("translate", False))
-
-        # 温度
-        self.groq_temperature_spin.setValue(groq_settings.get("temperature", 0.0))
-
-        # 字幕行数
-        self.groq_max_line_count.setValue(groq_settings.get("max_line_count", 2))
-
-        # 字符数
-        self.groq_max_line_width.setValue(groq_settings.get("max_line_width", 42))
-
-        # Deepgram设置
-        dg_settings = settings.get("deepgram", {})
-
-        # 模型
-        model = dg_settings.get("model", "nova-2")
-        index = self.dg_model_combo.findData(model)
-        if index >= 0:
-            self.dg_model_combo.setCurrentIndex(index)
-
-        # 版本
-        version = dg_settings.get("version", "")
-        if version and version != "latest":
-            self.dg_version_combo.setCurrentIndex(1)
-            self.dg_version_input.setText(version)
-            self.dg_version_input.setEnabled(True)
-        else:
-            self.dg_version_combo.setCurrentIndex(0)
-            self.dg_version_input.setEnabled(False)
-
-        # 智能格式化
-        self.dg_smart_format_check.setChecked(dg_settings.get("smart_format", True))
-
-        # 标点符号
-        self.dg_punctuate_check.setChecked(dg_settings.get("punctuate", True))
-
-        # 说话人分离
-        self.dg_diarize_check.setChecked(dg_settings.get("diarize", False))
-
-        # 语言检测
-        self.dg_detect_language_check.setChecked(dg_settings.get("detect_language", True))
-
-        # 多通道
-        self.dg_multichannel_check.setChecked(dg_settings.get("multichannel", False))
-
-        # 关键词
-        self.dg_keywords_input.setText(dg_settings.get("keywords", ""))
-
-        # 处理精度
-        tier = dg_settings.get("tier", "base")
-        index = self.dg_tier_combo.findData(tier)
-        if index >= 0:
-            self.dg_tier_combo.setCurrentIndex(index)
-
-        # 采样率
-        sample_rate = dg_settings.get("sample_rate", "")
-        index = self.dg_sample_rate_combo.findData(str(sample_rate))
-        if index >= 0:
-            self.dg_sample_rate_combo.setCurrentIndex(index)
-
-        # 时间戳
-        timestamps = dg_settings.get("timestamps", "word")
-        index = self.dg_timestamps_combo.findData(timestamps)
-        if index >= 0:
-            self.dg_timestamps_combo.setCurrentIndex(index)
-
-        # 置信度
-        confidence = dg_settings.get("confidence", 0.7)
-        self.dg_confidence_slider.setValue(int(confidence * 100))
-        self.dg_confidence_label.setText(f"{confidence:.1f}")
+        # 保留加载的设置，保存时在此基础上更新，无需再次读取
+        self._settings = settings
+
+        # 只加载已创建的选项卡，其余在创建时加载
+        if self._tab_built[0]:
+            self._load_groq_settings(settings.get("groq", {}))
+        if self._tab_built[1]:
+            self._load_deepgram_settings(settings.get("deepgram", {}))
+
+    def _load_groq_settings(self, groq_settings):
+        """将Groq设置加载到界面"""
+        with self._bulk_load(self._groq_inputs):
+            # 模型
+            model = groq_settings.get("model", "whisper-large-v3")
+            index = self._groq_model_index.get(model, -1)
+            if index >= 0:
+                self.groq_model_combo.setCurrentIndex(index)
+
+            # 时间戳
+            timestamps = groq_settings.get("timestamps", "granular")
+            index = self._groq_timestamps_index.get(timestamps, -1)
+            if index >= 0:
+                self.groq_timestamps_combo.setCurrentIndex(index)
+
+            # 检测语言
+            self.groq_detect_lang_check.setChecked(groq_settings.get("detect_language", True))
+
+            # 翻译
+            self.groq_translate_check.setChecked(groq_settings.get("translate", False))
+
+            # 温度
+            self.groq_temperature_spin.setValue(groq_settings.get("temperature", 0.0))
+
+            # 字幕行数
+            self.groq_max_line_count.setValue(groq_settings.get("max_line_count", 2))
+
+            # 字符数
+            self.groq_max_line_width.setValue(groq_settings.get("max_line_width", 42))
+
+    def _load_deepgram_settings(self, dg_settings):
+        """将Deepgram设置加载到界面"""
+        with self._bulk_load(self._dg_inputs):
+            # 模型
+            model = dg_settings.get("model", "nova-2")
+            index = self._dg_model_index.get(model, -1)
+            if index >= 0:
+                self.dg_model_combo.setCurrentIndex(index)
+
+            # 版本
+            version = dg_settings.get("version", "")
+            if version and version != "latest":
+                self.dg_version_combo.setCurrentIndex(1)
+                self.dg_version_input.setText(version)
+                self.dg_version_input.setEnabled(True)
+            else:
+                self.dg_version_combo.setCurrentIndex(0)
+                self.dg_version_input.setEnabled(False)
+
+            # 智能格式化
+            self.dg_smart_format_check.setChecked(dg_settings.get("smart_format", True))
+
+            # 标点符号
+            self.dg_punctuate_check.setChecked(dg_settings.get("punctuate", True))
+
+            # 说话人分离
+            self.dg_diarize_check.setChecked(dg_settings.get("diarize", False))
+
+            # 语言检测
+            self.dg_detect_language_check.setChecked(dg_settings.get("detect_language", True))
+
+            # 多通道
+            self.dg_multichannel_check.setChecked(dg_settings.get("multichannel", False))
+
+            # 关键词
+            self.dg_keywords_input.setText(dg_settings.get("keywords", ""))
+
+            # 处理精度
+            tier = dg_settings.get("tier", "base")
+            index = self._dg_tier_index.get(tier, -1)
+            if index >= 0:
+                self.dg_tier_combo.setCurrentIndex(index)
+
+            # 采样率
+            sample_rate = dg_settings.get("sample_rate", "")
+            index = self._dg_sample_rate_index.get(str(sample_rate), -1)
+            if index >= 0:
+                self.dg_sample_rate_combo.setCurrentIndex(index)
+
+            # 时间戳
+            timestamps = dg_settings.get("timestamps", "word")
+            index = self._dg_timestamps_index.get(timestamps, -1)
+            if index >= 0:
+                self.dg_timestamps_combo.setCurrentIndex(index)
+
+            # 置信度
+            confidence = dg_settings.get("confidence", 0.7)
+            self.dg_confidence_slider.setValue(int(confidence * 100))
+            self.dg_confidence_label.setText(f"{confidence:.1f}")
 
     def save_settings(self):
         """保存设置"""
-        settings = get_conversion_settings()  # 获取当前设置
-
-        # 更新Groq设置
-        groq_settings = {}
-        groq_settings["model"] = self.groq_model_combo.currentData()
-        groq_settings["timestamps"] = self.groq_timestamps_combo.currentData()
-        groq_settings["detect_language"] = self.groq_detect_lang_check.isChecked()
-        groq_settings["translate"] = self.groq_translate_check.isChecked()
-        groq_settings["temperature"] = self.groq_temperature_spin.value()
-        groq_settings["max_line_count"] = self.groq_max_line_count.value()
-        groq_settings["max_line_width"] = self.groq_max_line_width.value()
-
-        settings["groq"] = groq_settings
-
-        # 更新Deepgram设置
-        dg_settings = {}
-        dg_settings["model"] = self.dg_model_combo.currentData()
-
-        # 版本
-        if self.dg_version_combo.currentIndex() == 1 and self.dg_version_input.text():
-            dg_settings["version"] = self.dg_version_input.text().strip()
-        else:
-            dg_settings["version"] = "latest"
-
-        dg_settings["smart_format"] = self.dg_smart_format_check.isChecked()
-        dg_settings["punctuate"] = self.dg_punctuate_check.isChecked()
-        dg_settings["diarize"] = self.dg_diarize_check.isChecked()
-        dg_settings["detect_language"] = self.dg_detect_language_check.isChecked()
-        dg_settings["multichannel"] = self.dg_multichannel_check.isChecked()
-        dg_settings["keywords"] = self.dg_keywords_input.text().strip()
-        dg_settings["tier"] = self.dg_tier_combo.currentData()
-        dg_settings["sample_rate"] = self.dg_sample_rate_combo.currentData()
-        dg_settings["timestamps"] = self.dg_timestamps_combo.currentData()
-        dg_settings["confidence"] = self.dg_confidence_slider.value() / 100.0
-
-        settings["deepgram"] = dg_settings
+        settings = self._settings  # 加载时获取的当前设置
+
+        # 更新Groq设置（未打开过的选项卡保持原设置）
+        if self._tab_built[0]:
+            groq_settings = {}
+            groq_settings["model"] = self.groq_model_combo.currentData()
+            groq_settings["timestamps"] = self.groq_timestamps_combo.currentData()
+            groq_settings["detect_language"] = self.groq_detect_lang_check.isChecked()
+            groq_settings["translate"] = self.groq_translate_check.isChecked()
+            groq_settings["temperature"] = self.groq_temperature_spin.value()
+            groq_settings["max_line_count"] = self.groq_max_line_count.value()
+            groq_settings["max_line_width"] = self.groq_max_line_width.value()
+
+            settings["groq"] = groq_settings
+
+        # 更新Deepgram设置（未打开过的选项卡保持原设置）
+        if self._tab_built[1]:
+            dg_settings = {}
+            dg_settings["model"] = self.dg_model_combo.currentData()
+
+            # 版本
+            if self.dg_version_combo.currentIndex() == 1 and self.dg_version_input.text():
+                dg_settings["version"] = self.dg_version_input.text().strip()
+            else:
+                dg_settings["version"] = "latest"
+
+            dg_settings["smart_format"] = self.dg_smart_format_check.isChecked()
+            dg_settings["punctuate"] = self.dg_punctuate_check.isChecked()
+            dg_settings["diarize"] = self.dg_diarize_check.isChecked()
+            dg_settings["detect_language"] = self.dg_detect_language_check.isChecked()
+            dg_settings["multichannel"] = self.dg_multichannel_check.isChecked()
+            dg_settings["keywords"] = self.dg_keywords_input.text().strip()
+            dg_settings["tier"] = self.dg_tier_combo.currentData()
+            dg_settings["sample_rate"] = self.dg_sample_rate_combo.currentData()
+            dg_settings["timestamps"] = self.dg_timestamps_combo.currentData()
+            dg_settings["confidence"] = self.dg_confidence_slider.value() / 100.0
+
+            settings["deepgram"] = dg_settings
 
         # 保存所有设置
         save_conversion_settings(settings)
@@ -1,6 +1,29 @@
 # utils/subtitle_formatter.py
 import re
+import threading
+from functools import lru_cache
 
+# 自然分隔符（分割时保留分隔符）
+_SPLIT_RE = re.compile(r'([,.!?;，。！？；])')
+_SEP_SET = frozenset(",.!?;，。！？；")
+
+# 每个线程复用的临时列表（结果在返回前已拼接成新字符串，复用是安全的）
+_tls = threading.local()
+
+
+def _buffers():
+    """获取当前线程的临时列表(chunks, current_parts)，返回前已清空"""
+    buffers = getattr(_tls, "buffers", None)
+    if buffers is None:
+        buffers = _tls.buffers = ([], [])
+    chunks, current_parts = buffers
+    chunks.clear()
+    current_parts.clear()
+    return buffers
+
+
+# 转写结果中常有重复的短语（如"谢谢观看"），缓存格式化结果
+@lru_cache(maxsize=4096)
 def format_subtitle_text(text, max_line_count=2, max_line_width=42):
     """格式化字幕文本
     
@@ -15,39 +38,47 @@ def format_subtitle_text(text, max_line_count=2, max_line_width=42):
     # 如果文本很短，直接返回
     if len(text) <= max_line_width:
         return text
+
+    # 没有任何分隔符时分割结果只有一段，原样返回，无需分割
+    if _SEP_SET.isdisjoint(text):
+        return text
         
     # 将文本按自然分隔符分割
     # 保留分隔符在分割结果中
-    parts = re.split(r'([,.!?;，。！？；])', text)
+    parts = _SPLIT_RE.split(text)
     
-    # 重新组合分隔符和文本
-    chunks = []
-    current = ""
+    # 重新组合分隔符和文本（先收集片段，换行时一次拼接，避免反复拼接字符串）
+    chunks, current_parts = _buffers()
+    current_len = 0
     for i in range(0, len(parts), 2):
-        if i < len(parts):
-            part = parts[i]
-            # 如果后面有分隔符，加上它
-            if i + 1 < len(parts):
-                part += parts[i + 1]
-            
-            # 如果当前行加上新部分不超过限制，添加到当前行
-            if len(current) + len(part) <= max_line_width:
-                current += part
-            else:
-                # 否则开始新行
-                if current:
-                    chunks.append(current)
-                current = part
-    
+        text_part = parts[i]
+        # 如果后面有分隔符，加上它
+        sep = parts[i + 1] if i + 1 < len(parts) else ""
+        part_len = len(text_part) + len(sep)
+
+        # 如果当前行加上新部分不超过限制，添加到当前行
+        if current_len + part_len <= max_line_width:
+            current_parts.append(text_part)
+            current_parts.append(sep)
+            current_len += part_len
+        else:
+            # 否则开始新行
+            if current_len:
+                chunks.append("".join(current_parts))
+            current_parts.clear()
+            current_parts.append(text_part)
+            current_parts.append(sep)
+            current_len = part_len
+
     # 添加最后一行
-    if current:
-        chunks.append(current)
-        
+    if current_len:
+        chunks.append("".join(current_parts))
+
     # 限制行数
     if len(chunks) > max_line_count:
         # 如果超过最大行数，合并多余的行
         remaining_text = " ".join(chunks[max_line_count-1:])
-        chunks = chunks[:max_line_count-1]
+        del chunks[max_line_count-1:]
         
         # 将剩余文本截断到适合最后一行的长度
         if len(remaining_text) > max_line_width:
@@ -1,8 +1,37 @@
-import os
 import asyncio
 import traceback
+from dataclasses import asdict
+from functools import partial
 from PySide6.QtCore import QThread, Signal
 
+from service_config import make_service_settings
+
+# 工作线程依赖的函数，首次运行时导入后缓存
+_worker_deps = None
+
+
+def _get_worker_deps():
+    """获取工作线程依赖的函数
+
+    首次调用时导入（在线程中导入以避免阻塞主线程），之后直接返回缓存
+
+    返回:
+    - (create_client, print_debug, get_proxy_settings)
+    """
+    global _worker_deps
+    if _worker_deps is None:
+        from api_clients import create_client, print_debug
+        from config_manager import get_proxy_settings
+        _worker_deps = (create_client, print_debug, get_proxy_settings)
+    return _worker_deps
+
+
+def _print_traceback(message, exc):
+    """通过print_debug输出异常及其堆栈"""
+    print_debug = _get_worker_deps()[1]
+    stack = "".join(traceback.format_exception(type(exc), exc, exc.__traceback__))
+    print_debug(f"{message}\n{stack.rstrip()}")
+
 
 class ProcessWorker(QThread):
     """处理工作线程"""
@@ -19,15 +48,17 @@ class ProcessWorker(QThread):
         self.service = service
         self.output_format = output_format
         self.language = language
-        self.service_settings = service_settings or {}
+        self.service_settings = make_service_settings(service, service_settings or {})
+        # 服务特定的转写选项只需生成一次，所有文件共用
+        self._service_options = asdict(self.service_settings) if self.service_settings is not None else {}
         self.client = None
+        self.max_concurrency = 4  # 同时上传转写的最大文件数
 
     def run(self):
         """运行处理任务"""
-        # 导入必要的模块 (在线程中导入以避免阻塞主线程)
+        # 导入必要的模块 (在线程中导入以避免阻塞主线程，只导入一次)
         try:
-            from api_clients import create_client, print_debug
-            from config_manager import get_proxy_settings
+            create_client, print_debug, get_proxy_settings = _get_worker_deps()
         except ImportError as e:
             for file in self.audio_files:
                 self.error_file.emit(file, f"模块导入错误: {str(e)}")
@@ -46,29 +77,31 @@ class ProcessWorker(QThread):
             loop = asyncio.new_event_loop()
             asyncio.set_event_loop(loop)
 
-            # 创建任务列表
+            # 创建任务列表（限制并发数，避免同时上传过多文件）
+            semaphore = asyncio.Semaphore(self.max_concurrency)
             tasks = []
             for file_path in self.audio_files:
-                tasks.append(self.process_file(self.client, file_path))
+                tasks.append(self.process_file_limited(semaphore, self.client, file_path))
 
             # 执行任务
             print_debug(f"开始执行 {len(tasks)} 个任务")
-            loop.run_until_complete(asyncio.gather(*tasks))
+            completed = loop.run_until_complete(self.run_tasks(tasks))
 
             # 完成后安全地关闭事件循环
             loop.run_until_complete(loop.shutdown_asyncgens())
             loop.close()
 
             # 执行清理
-            print_debug("任务执行完毕")
+            print_debug("任务执行完毕" if completed else "任务已被中断")
 
             # 发出完成信号
-            self.all_completed.emit()
+            if completed:
+                self.all_completed.emit()
 
         except Exception as e:
             # 全局错误处理
             print_debug(f"执行过程中发生错误: {e}")
-            traceback.print_exc()
+            _print_traceback("工作线程执行出错", e)
             for file_path in self.audio_files:
                 self.error_file.emit(file_path, f"初始化错误: {str(e)}")
         finally:
@@ -77,41 +110,62 @@ class ProcessWorker(QThread):
                 print_debug("线程结束，关闭客户端")
                 self.client.close()
 
+    async def run_tasks(self, tasks):
+        """并发执行所有任务，逐个收取已完成的任务，期间定期检查中断请求
+
+        返回:
+        - 是否全部执行完毕（被中断时返回False）
+        """
+        pending = {asyncio.ensure_future(task) for task in tasks}
+        while pending:
+            if self.isInterruptionRequested():
+                # 取消仍在等待网络响应的任务，让线程尽快退出
+                for task in pending:
+                    task.cancel()
+                await asyncio.gather(*pending, return_exceptions=True)
+                return False
+
+            # 已完成的任务立即释放，不必等最慢的文件
+            done, pending = await asyncio.wait(
+                pending, timeout=0.2, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                # 单个任务出错不影响其他任务
+                if not task.cancelled() and task.exception() is not None:
+                    _print_traceback("任务执行出错", task.exception())
+
+        return True
+
+    def _emit_progress(self, file_path, stage, percentage):
+        """发出文件进度信号"""
+        self.progress.emit(file_path, stage, percentage)
+
+    async def process_file_limited(self, semaphore, client, file_path):
+        """在并发数限制内处理单个文件"""
+        async with semaphore:
+            await self.process_file(client, file_path)
+
     async def process_file(self, client, file_path):
         """处理单个文件"""
+        if self.isInterruptionRequested():
+            return
+
         try:
             # 发出开始信号
             self.started_file.emit(file_path)
 
-            # 定义进度回调
-            file_name = os.path.basename(file_path)
-
-            def progress_callback(stage, percentage):
-                self.progress.emit(file_path, stage, percentage)
+            # 进度回调（绑定文件路径）
+            progress_callback = partial(self._emit_progress, file_path)
 
-            # 准备转写选项
+            # 准备转写选项（含服务特定选项）
             transcribe_options = {
+                **self._service_options,
                 "file_path": file_path,
                 "output_format": self.output_format,
                 "language": self.language,
                 "progress_callback": progress_callback
             }
 
-            # 添加服务特定选项
-            if self.service == "groq":
-                # 为Groq服务添加选项
-                for key in ['model', 'timestamps', 'temperature', 'translate', 'max_line_count', 'max_line_width']:
-                    if key in self.service_settings:
-                        transcribe_options[key] = self.service_settings[key]
-
-            elif self.service == "deepgram":
-                # 为Deepgram服务添加选项
-                for key, value in self.service_settings.items():
-                    if key in ['model', 'version', 'smart_format', 'punctuate', 'diarize',
-                               'detect_language', 'multichannel', 'keywords', 'tier',
-                               'sample_rate', 'timestamps', 'confidence']:
-                        transcribe_options[key] = value
-
             # 执行转写
             output_path = await client.transcribe(**transcribe_options)
 
@@ -121,5 +175,5 @@ class ProcessWorker(QThread):
         except Exception as e:
             # 发出错误信号
             error_msg = str(e)
-            traceback.print_exc()
+            _print_traceback(f"转写失败: {file_path}", e)
             self.error_file.emit(file_path, error_msg)
\ No newline at end of file
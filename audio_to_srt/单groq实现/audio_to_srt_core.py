@@ -195,6 +195,15 @@ def create_srt_from_segments(segments):
     return srt_content
 
 
+def write_output(path, content):
+    """将转写结果写入文件
+
+    内容已完整保存在内存中，一次编码、一次写入即可
+    """
+    with open(path, "w", encoding="utf-8") as output_file:
+        output_file.write(content)
+
+
 def transcribe_audio(audio_file_path, output_path=None, model="whisper-large-v3", language=None,
                      output_format="srt", progress_callback=None, max_segment_size=None):
     """
@@ -337,8 +346,7 @@ def transcribe_audio(audio_file_path, output_path=None, model="whisper-large-v3"
                 progress_callback("downloading", 0)
 
             # 写入文件
-            with open(output_path, "w", encoding="utf-8") as output_file:
-                output_file.write(content)
+            write_output(output_path, content)
 
             if progress_callback:
                 progress_callback("downloading", 100)
@@ -392,8 +400,7 @@ def split_output_file(content, output_path, output_format, max_segment_size):
             # 如果超过大小限制，保存当前内容并开始新文件
             if len(test_content.encode('utf-8')) > max_segment_size and current_content:
                 part_path = f"{base_path}_part{current_part}{extension}"
-                with open(part_path, "w", encoding="utf-8") as f:
-                    f.write(current_content)
+                write_output(part_path, current_content)
                 file_paths.append(part_path)
 
                 # 重置变量
@@ -408,8 +415,7 @@ def split_output_file(content, output_path, output_format, max_segment_size):
         # 保存最后一部分
         if current_content:
             part_path = f"{base_path}_part{current_part}{extension}"
-            with open(part_path, "w", encoding="utf-8") as f:
-                f.write(current_content)
+            write_output(part_path, current_content)
             file_paths.append(part_path)
     else:
         # 拆分纯文本文件
@@ -428,8 +434,7 @@ def split_output_file(content, output_path, output_format, max_segment_size):
             # 如果超过大小限制，保存当前内容并开始新文件
             if len(test_content.encode('utf-8')) > max_segment_size and current_content:
                 part_path = f"{base_path}_part{current_part}{extension}"
-                with open(part_path, "w", encoding="utf-8") as f:
-                    f.write(current_content)
+                write_output(part_path, current_content)
                 file_paths.append(part_path)
 
                 # 重置变量
@@ -442,8 +447,7 @@ def split_output_file(content, output_path, output_format, max_segment_size):
         # 保存最后一部分
         if current_content:
             part_path = f"{base_path}_part{current_part}{extension}"
-            with open(part_path, "w", encoding="utf-8") as f:
-                f.write(current_content)
+            write_output(part_path, current_content)
             file_paths.append(part_path)
 
     return file_paths
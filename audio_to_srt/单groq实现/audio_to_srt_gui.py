@@ -1,15 +1,19 @@
 import os
 import sys
 import json
+import time
 import traceback
+from contextlib import contextmanager
+from functools import lru_cache
 from PySide6.QtWidgets import (QApplication, QMainWindow, QFileDialog,
                                QMessageBox, QWidget, QVBoxLayout, QHBoxLayout,
                                QLabel, QPushButton, QComboBox, QLineEdit,
-                               QTextEdit, QProgressBar, QCheckBox, QGroupBox,
+                               QPlainTextEdit, QProgressBar, QCheckBox, QGroupBox,
                                QRadioButton, QSpinBox, QDialog, QFormLayout,
                                QButtonGroup)
-from PySide6.QtCore import Qt, QThread, Signal, QCoreApplication, QFile, QResource
-from PySide6.QtGui import QIcon, QFont
+from PySide6.QtCore import (Qt, QObject, QRunnable, QThreadPool, Signal, QCoreApplication,
+                            QFile, QResource)
+from PySide6.QtGui import QIcon, QFont, QStandardItemModel, QStandardItem
 
 # 导入核心模块中的变量和函数
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
@@ -21,6 +25,52 @@ from audio_to_srt_core import (transcribe_audio, transcribe_audio_to_srt,
                                get_last_used_key, save_last_used_key)
 
 
+@contextmanager
+def batch_update(combo):
+    """批量修改下拉框：期间屏蔽信号并暂停重绘，结束后统一刷新"""
+    combo.blockSignals(True)
+    combo.setUpdatesEnabled(False)
+    try:
+        yield combo
+    finally:
+        combo.setUpdatesEnabled(True)
+        combo.blockSignals(False)
+
+
+@lru_cache(maxsize=256)
+def _format_key_display(name, key):
+    """生成密钥的显示文本，只显示密钥首尾部分"""
+    masked = f"{key[:5]}...{key[-4:]}"
+    return f"{name}: {masked}" if name != key else masked
+
+
+def _build_combo_model(entries):
+    """由(显示文本, 数据)序列构建下拉框数据模型，数据存放在Qt.UserRole中"""
+    model = QStandardItemModel()
+    for text, data in entries:
+        item = QStandardItem(text)
+        item.setData(data, Qt.UserRole)
+        model.appendRow(item)
+    return model
+
+
+@lru_cache(maxsize=None)
+def _model_combo_model():
+    """模型下拉框的共享数据模型，首次使用时创建"""
+    return _build_combo_model(
+        (f"{model_info['name']} - {model_info['description']}", model_id)
+        for model_id, model_info in supported_models.items()
+    )
+
+
+@lru_cache(maxsize=None)
+def _lang_combo_model():
+    """语言下拉框的共享数据模型，首次使用时创建"""
+    return _build_combo_model(
+        (lang_name, lang_code) for lang_code, lang_name in supported_languages.items()
+    )
+
+
 class ProxySettingsDialog(QDialog):
     """代理设置对话框"""
 
@@ -122,11 +172,12 @@ class APIKeyDialog(QDialog):
 
     def refresh_keys(self):
         """刷新密钥列表"""
-        self.key_list.clear()
         keys = get_api_keys()
-        for name, key in keys.items():
-            display_text = f"{name}: {key[:5]}...{key[-4:]}" if name != key else f"{key[:5]}...{key[-4:]}"
-            self.key_list.addItem(display_text, (name, key))
+        with batch_update(self.key_list):
+            self.key_list.clear()
+            for name, key in keys.items():
+                display_text = _format_key_display(name, key)
+                self.key_list.addItem(display_text, (name, key))
 
         # 更新删除按钮状态
         self.remove_btn.setEnabled(self.key_list.count() > 0)
@@ -186,74 +237,21 @@ class APIKeyDialog(QDialog):
             if self.parent_window:
                 self.parent_window.load_api_keys()
 
-    def refresh_keys(self):
-        """刷新密钥列表"""
-        self.key_list.clear()
-        keys = get_api_keys()
-        for name, key in keys.items():
-            display_text = f"{name}: {key[:5]}...{key[-4:]}" if name != key else f"{key[:5]}...{key[-4:]}"
-            self.key_list.addItem(display_text, (name, key))
-
-        # 更新删除按钮状态
-        self.remove_btn.setEnabled(self.key_list.count() > 0)
-
-    def add_key(self):
-        """添加新密钥"""
-        name = self.key_name_input.text().strip()
-        key = self.key_value_input.text().strip()
-
-        if not key:
-            QMessageBox.warning(self, "错误", "请输入API密钥")
-            return
-
-        if not key.startswith("gsk_"):
-            QMessageBox.warning(self, "错误", "Groq API密钥通常以gsk_开头")
-            return
-
-        # 如果未提供名称，使用密钥值作为名称
-        if not name:
-            name = key
-
-        # 添加密钥
-        add_api_key(name, key)
-
-        # 清空输入框
-        self.key_name_input.clear()
-        self.key_value_input.clear()
-
-        # 刷新列表
-        self.refresh_keys()
-
-    def remove_key(self):
-        """删除所选密钥"""
-        if self.key_list.currentIndex() < 0:
-            return
-
-        name, _ = self.key_list.currentData()
-
-        # 确认删除
-        reply = QMessageBox.question(
-            self,
-            "确认删除",
-            f"确定要删除这个API密钥吗?",
-            QMessageBox.Yes | QMessageBox.No,
-            QMessageBox.No
-        )
 
-        if reply == QMessageBox.Yes:
-            remove_api_key(name)
-            self.refresh_keys()
-
-
-class TranscriptionWorker(QThread):
-    """后台转写工作线程"""
+class TranscriptionSignals(QObject):
+    """转写任务的信号（QRunnable本身不能定义信号）"""
     finished = Signal(list)  # 成功信号，返回生成的文件路径列表
     error = Signal(str)  # 错误信号，返回错误信息
     progress = Signal(int)  # 进度信号，0-100
     warning = Signal(str)  # 警告信号，返回警告信息
 
+
+class TranscriptionWorker(QRunnable):
+    """后台转写任务，在全局线程池中执行，避免每次转换都新建线程"""
+
     def __init__(self, audio_file, api_key, model, language, auto_detect, output_format, max_size):
         super().__init__()
+        self.signals = TranscriptionSignals()
         self.audio_file = audio_file
         self.api_key = api_key
         self.model = model
@@ -261,48 +259,28 @@ class TranscriptionWorker(QThread):
         self.auto_detect = auto_detect
         self.output_format = output_format
         self.max_size = max_size
+        # 上次发出的进度及时间，用于合并过于频繁的进度回调
+        self._last_pct = -1
+        self._last_emit = 0.0
 
     def run(self):
         try:
-            # 检查是否安装了requests库
-            try:
-                import requests
-            except ImportError:
-                try:
-                    import pip
-                    self.progress.emit(5)
-                    pip.main(['install', 'requests'])
-                    self.progress.emit(10)
-                    import requests
-                except Exception as e:
-                    error_msg = "错误: 无法安装必要的依赖包 'requests'。请手动安装: pip install requests"
-                    self.error.emit(error_msg)
-                    return
-
             # 进度更新
-            self.progress.emit(15)
+            self.signals.progress.emit(15)
 
             # 设置环境变量
             os.environ["GROQ_API_KEY"] = self.api_key
 
             # 生成输出文件路径
-            base_name = os.path.splitext(self.audio_file)[0]
+            parent, file_name = os.path.split(self.audio_file)
+            # 只对文件名去掉扩展名；以点开头且无其他扩展名时保留原名，与os.path.splitext一致
+            stem = file_name.rpartition(".")[0]
+            if not stem.strip("."):
+                stem = file_name
             extension = ".srt" if self.output_format == "srt" else ".txt"
-            output_path = f"{base_name}{extension}"
-
-            # 检查文件是否已存在，如果存在则重命名
-            counter = 1
-            while os.path.exists(output_path):
-                output_path = f"{base_name}_{counter}{extension}"
-                counter += 1
-
-            self.progress.emit(20)
+            output_path = self._unique_output_path(parent, stem, extension)
 
-            # 保存最后使用的API密钥
-            save_last_used_key(self.api_key)
-
-            # 保存输出格式设置
-            save_output_format(self.output_format)
+            self.signals.progress.emit(20)
 
             # 调用转写函数
             output_paths = transcribe_audio(
@@ -315,36 +293,65 @@ class TranscriptionWorker(QThread):
                 max_segment_size=self.max_size
             )
 
-            self.progress.emit(100)
-            self.finished.emit(output_paths)
+            self.signals.progress.emit(100)
+            self.signals.finished.emit(output_paths)
 
         except Exception as e:
             error_msg = f"错误: {str(e)}\n\n{traceback.format_exc()}"
-            self.error.emit(error_msg)
+            self.signals.error.emit(error_msg)
+
+    @staticmethod
+    def _unique_output_path(parent, base, extension):
+        """生成不与已有文件重名的输出路径
+
+        只扫描一次所在目录，之后在内存中查找可用的文件名
+        """
+        try:
+            with os.scandir(parent or ".") as entries:
+                existing = {os.path.normcase(entry.name) for entry in entries}
+        except OSError:
+            existing = set()
+
+        # 检查文件是否已存在，如果存在则重命名
+        candidate = f"{base}{extension}"
+        counter = 1
+        while os.path.normcase(candidate) in existing:
+            candidate = f"{base}_{counter}{extension}"
+            counter += 1
+
+        return os.path.join(parent, candidate)
 
     def update_progress(self, stage, percentage):
         """更新进度条，根据不同阶段调整进度"""
         if stage == "uploading":
             # 上传阶段占20%到40%
             progress = 20 + int(percentage * 0.2)
-            self.progress.emit(progress)
+            self._emit_progress(progress)
         elif stage == "processing":
             # 处理阶段占40%到90%
             progress = 40 + int(percentage * 0.5)
-            self.progress.emit(progress)
+            self._emit_progress(progress)
         elif stage == "downloading":
             # 下载和保存阶段占90%到100%
             progress = 90 + int(percentage * 0.1)
-            self.progress.emit(progress)
+            self._emit_progress(progress)
         elif stage == "warning":
             # 发出警告信号
-            self.warning.emit("使用SOCKS代理需要安装PySocks库。请使用pip install PySocks命令安装后再尝试。")
+            self.signals.warning.emit("使用SOCKS代理需要安装PySocks库。请使用pip install PySocks命令安装后再尝试。")
         elif stage == "error":
             # 发出错误信号
-            self.error.emit("代理设置错误，请检查代理配置。")
+            self.signals.error.emit("代理设置错误，请检查代理配置。")
         else:
             return
 
+    def _emit_progress(self, progress):
+        """发出进度信号：仅在百分比变化且距上次发出超过50毫秒时才发出"""
+        now = time.monotonic()
+        if progress != self._last_pct and now - self._last_emit > 0.05:
+            self._last_pct = progress
+            self._last_emit = now
+            self.signals.progress.emit(progress)
+
 
 class AudioToSrtGUI(QMainWindow):
     """音频转SRT字幕GUI主窗口"""
@@ -355,7 +362,6 @@ class AudioToSrtGUI(QMainWindow):
         # 设置窗口属性
         self.setWindowTitle("音频转SRT/文本工具")
         self.setMinimumSize(650, 550)
-        self.setWindowFlags(self.windowFlags() | Qt.WindowStaysOnTopHint)
 
         # 创建中心部件
         central_widget = QWidget()
@@ -419,8 +425,7 @@ class AudioToSrtGUI(QMainWindow):
         model_select_layout = QHBoxLayout()
         model_label = QLabel("选择模型:")
         self.model_combo = QComboBox()
-        for model_id, model_info in supported_models.items():
-            self.model_combo.addItem(f"{model_info['name']} - {model_info['description']}", model_id)
+        self.model_combo.setModel(_model_combo_model())
         model_select_layout.addWidget(model_label)
         model_select_layout.addWidget(self.model_combo)
 
@@ -428,8 +433,7 @@ class AudioToSrtGUI(QMainWindow):
         lang_layout = QHBoxLayout()
         lang_label = QLabel("选择语言:")
         self.lang_combo = QComboBox()
-        for lang_code, lang_name in supported_languages.items():
-            self.lang_combo.addItem(lang_name, lang_code)
+        self.lang_combo.setModel(_lang_combo_model())
         self.auto_detect_lang = QCheckBox("自动检测语言")
         self.auto_detect_lang.setChecked(True)
         self.auto_detect_lang.stateChanged.connect(self.toggle_language_combo)
@@ -441,12 +445,15 @@ class AudioToSrtGUI(QMainWindow):
         format_layout = QHBoxLayout()
         format_label = QLabel("输出格式:")
         self.format_group = QButtonGroup(self)
+        # 按钮ID即格式在该列表中的下标
+        self._format_keys = list(supported_formats)
+        saved_format = get_output_format()
 
-        for format_id, format_desc in supported_formats.items():
+        for idx, (format_id, format_desc) in enumerate(supported_formats.items()):
             radio_btn = QRadioButton(format_desc)
-            if format_id == get_output_format():
+            if format_id == saved_format:
                 radio_btn.setChecked(True)
-            self.format_group.addButton(radio_btn, id=list(supported_formats.keys()).index(format_id))
+            self.format_group.addButton(radio_btn, id=idx)
             format_layout.addWidget(radio_btn)
 
         model_layout.addLayout(model_select_layout)
@@ -480,16 +487,28 @@ class AudioToSrtGUI(QMainWindow):
         main_layout.addWidget(self.convert_btn)
 
         # 日志区域
+        log_header_layout = QHBoxLayout()
         log_label = QLabel("日志输出:")
-        main_layout.addWidget(log_label)
-
-        self.log_text = QTextEdit()
+        # 窗口置顶改为按需开启
+        self.stay_on_top_check = QCheckBox("窗口置顶")
+        self.stay_on_top_check.toggled.connect(self.toggle_stay_on_top)
+        log_header_layout.addWidget(log_label)
+        log_header_layout.addStretch(1)
+        log_header_layout.addWidget(self.stay_on_top_check)
+        main_layout.addLayout(log_header_layout)
+
+        self.log_text = QPlainTextEdit()
         self.log_text.setReadOnly(True)
+        # 限制日志行数，避免长时间运行后内存和排版开销无限增长
+        self.log_text.setMaximumBlockCount(2000)
         main_layout.addWidget(self.log_text)
 
         # 初始化变量
         self.audio_file_path = None
         self.worker = None
+        self._error_dialog = None  # 错误提示框，首次出错时创建后复用
+        self._api_dialog = None  # 密钥管理对话框，首次打开时创建后复用
+        self._proxy_dialog = None  # 代理设置对话框，首次打开时创建后复用
 
         # 加载设置
         self.load_api_keys()
@@ -497,23 +516,25 @@ class AudioToSrtGUI(QMainWindow):
 
     def load_api_keys(self):
         """从配置文件加载API密钥"""
-        # 清空当前密钥列表
-        self.api_key_combo.clear()
-
         # 获取所有API密钥
         keys = get_api_keys()
+        last_key = get_last_used_key()
 
-        for name, key in keys.items():
-            display_text = f"{name}: {key[:5]}...{key[-4:]}" if name != key else f"{key[:5]}...{key[-4:]}"
-            self.api_key_combo.addItem(display_text, key)
+        with batch_update(self.api_key_combo):
+            # 清空当前密钥列表
+            self.api_key_combo.clear()
 
-        # 设置上次使用的密钥
-        last_key = get_last_used_key()
-        if last_key:
-            for i in range(self.api_key_combo.count()):
-                if self.api_key_combo.itemData(i) == last_key:
-                    self.api_key_combo.setCurrentIndex(i)
-                    break
+            # 记录密钥值到下标的映射（同值时保留第一个）
+            self._key_index = {}
+            for i, (name, key) in enumerate(keys.items()):
+                display_text = _format_key_display(name, key)
+                self.api_key_combo.addItem(display_text, key)
+                self._key_index.setdefault(key, i)
+
+            # 设置上次使用的密钥
+            idx = self._key_index.get(last_key) if last_key else None
+            if idx is not None:
+                self.api_key_combo.setCurrentIndex(idx)
 
         if self.api_key_combo.count() > 0:
             self.log(f"已加载 {self.api_key_combo.count()} 个API密钥")
@@ -531,41 +552,61 @@ class AudioToSrtGUI(QMainWindow):
 
     def open_api_key_manager(self):
         """打开API密钥管理器"""
-        dialog = APIKeyDialog(self)
+        if self._api_dialog is None:
+            self._api_dialog = APIKeyDialog(self)
+        else:
+            # 复用对话框时重新读取密钥
+            self._api_dialog.refresh_keys()
         # 不论对话框如何关闭，都重新加载密钥列表
-        dialog.exec()
+        self._api_dialog.exec()
         # 强制刷新密钥列表
         self.load_api_keys()
 
     def open_proxy_settings(self):
         """打开代理设置对话框"""
-        dialog = ProxySettingsDialog(self)
-        if dialog.exec():
+        if self._proxy_dialog is None:
+            self._proxy_dialog = ProxySettingsDialog(self)
+        else:
+            # 复用对话框时恢复为已保存的代理设置，丢弃上次取消的输入
+            self._proxy_dialog.proxy_input.setText(get_proxy_settings())
+        if self._proxy_dialog.exec():
             self.load_proxy_settings()
 
+    def toggle_stay_on_top(self, checked):
+        """切换窗口置顶状态"""
+        self.setWindowFlag(Qt.WindowStaysOnTopHint, checked)
+        # 修改窗口标志后窗口会被隐藏，需要重新显示
+        self.show()
+
     def toggle_language_combo(self, state):
         """切换语言选择下拉框的启用状态"""
         self.lang_combo.setEnabled(not state)
 
     def select_audio_file(self):
         """选择音频文件"""
-        file_dialog = QFileDialog()
-        file_dialog.setFileMode(QFileDialog.ExistingFile)
-        file_dialog.setNameFilter("音频文件 (*.mp3 *.mp4 *.wav *.m4a *.ogg *.opus *.webm *.mpeg *.mpga)")
+        # 使用静态方法，平台支持时直接调用系统原生对话框
+        file_path, _ = QFileDialog.getOpenFileName(
+            self,
+            "选择音频文件",
+            "",
+            "音频文件 (*.mp3 *.mp4 *.wav *.m4a *.ogg *.opus *.webm *.mpeg *.mpga)"
+        )
 
-        if file_dialog.exec():
-            file_paths = file_dialog.selectedFiles()
-            self.audio_file_path = file_paths[0]
+        if file_path:
+            self.audio_file_path = file_path
             self.file_path_label.setText(self.audio_file_path)
             self.convert_btn.setEnabled(True)
             self.log("已选择文件: " + self.audio_file_path)
 
     def log(self, message):
         """添加日志消息"""
-        self.log_text.append(message)
-        # 滚动到底部
-        scrollbar = self.log_text.verticalScrollBar()
-        scrollbar.setValue(scrollbar.maximum())
+        # 纯文本追加，光标位于末尾时会自动滚动到底部
+        self.log_text.appendPlainText(message)
+
+    def log_many(self, messages):
+        """一次追加多条日志消息，只触发一次排版"""
+        if messages:
+            self.log_text.appendPlainText("\n".join(messages))
 
     def start_conversion(self):
         """开始转换过程"""
@@ -589,7 +630,7 @@ class AudioToSrtGUI(QMainWindow):
         auto_detect = self.auto_detect_lang.isChecked()
 
         # 获取输出格式
-        output_format = list(supported_formats.keys())[self.format_group.checkedId()]
+        output_format = self._format_keys[self.format_group.checkedId()]
 
         # 禁用界面元素
         self.convert_btn.setEnabled(False)
@@ -599,10 +640,16 @@ class AudioToSrtGUI(QMainWindow):
         self.progress_bar.setValue(0)
 
         # 日志
-        self.log(f"开始转换: {os.path.basename(self.audio_file_path)}")
-        self.log(f"使用模型: {model}")
-        self.log(f"语言设置: {'自动检测' if auto_detect else language}")
-        self.log(f"输出格式: {supported_formats[output_format]}")
+        self.log_many([
+            f"开始转换: {os.path.basename(self.audio_file_path)}",
+            f"使用模型: {model}",
+            f"语言设置: {'自动检测' if auto_detect else language}",
+            f"输出格式: {supported_formats[output_format]}",
+        ])
+
+        # 在主线程中保存本次使用的密钥和输出格式，工作线程启动后直接开始转写
+        save_last_used_key(api_key)
+        save_output_format(output_format)
 
         # 创建并启动工作线程
         self.worker = TranscriptionWorker(
@@ -615,12 +662,12 @@ class AudioToSrtGUI(QMainWindow):
             None  # 移除了大文件拆分功能
         )
 
-        self.worker.progress.connect(self.update_progress)
-        self.worker.finished.connect(self.on_conversion_finished)
-        self.worker.error.connect(self.on_conversion_error)
-        self.worker.warning.connect(self.on_conversion_warning)
+        self.worker.signals.progress.connect(self.update_progress)
+        self.worker.signals.finished.connect(self.on_conversion_finished)
+        self.worker.signals.error.connect(self.on_conversion_error)
+        self.worker.signals.warning.connect(self.on_conversion_warning)
 
-        self.worker.start()
+        QThreadPool.globalInstance().start(self.worker)
 
     def on_conversion_warning(self, warning_message):
         """处理转换过程中的警告"""
@@ -639,9 +686,8 @@ class AudioToSrtGUI(QMainWindow):
         if len(file_paths) == 1:
             self.log(f"转换完成! 文件已保存至: {file_paths[0]}")
         else:
-            self.log(f"转换完成! 生成了{len(file_paths)}个文件:")
-            for path in file_paths:
-                self.log(f"  - {path}")
+            self.log_many([f"转换完成! 生成了{len(file_paths)}个文件:"]
+                          + [f"  - {path}" for path in file_paths])
 
         # 重新启用界面元素
         self.convert_btn.setEnabled(True)
@@ -676,12 +722,13 @@ class AudioToSrtGUI(QMainWindow):
         self.progress_bar.setValue(0)
 
         # 显示错误消息
-        error_dialog = QMessageBox(self)
-        error_dialog.setWindowTitle("转换错误")
-        error_dialog.setIcon(QMessageBox.Critical)
-        error_dialog.setText("转换过程中发生错误")
-        error_dialog.setDetailedText(error_message)
-        error_dialog.exec()
+        if self._error_dialog is None:
+            self._error_dialog = QMessageBox(self)
+            self._error_dialog.setWindowTitle("转换错误")
+            self._error_dialog.setIcon(QMessageBox.Critical)
+            self._error_dialog.setText("转换过程中发生错误")
+        self._error_dialog.setDetailedText(error_message)
+        self._error_dialog.exec()
 
 
 if __name__ == "__main__":
@@ -1,13 +1,169 @@
 import sys
 import os
 import json
-import re
+from functools import lru_cache
 from PySide6.QtWidgets import (QApplication, QMainWindow, QSplitter,
                                QTextEdit, QVBoxLayout, QHBoxLayout, QWidget, QLabel,
                                QCheckBox, QGroupBox, QPushButton, QScrollArea)
-from PySide6.QtCore import Qt, QTimer, QSettings, QRect
+from PySide6.QtCore import Qt, QEvent, QSettings, QRect
 from PySide6.QtGui import QClipboard, QTextDocument
 
+# 优先使用regex模块，未安装时回退到标准库re
+try:
+    import regex as re
+    _P = "+"
+except ImportError:
+    import re
+    # 标准库re从Python 3.11起才支持占有量词
+    _P = "+" if sys.version_info >= (3, 11) else ""
+
+# 优化HTML用到的正则表达式，模块加载时编译一次
+# [^>]*、[^"]*等后面紧跟的字符不可能被其本身匹配，改用占有量词(*+)不影响结果，只是省去匹配失败时的回溯
+_HTML_HEAD_RE = re.compile(rf'<html[^>]*{_P}>.*?<body[^>]*{_P}>', re.DOTALL | re.IGNORECASE)
+_HTML_TAIL_RE = re.compile(r'</body>.*?</html>', re.DOTALL | re.IGNORECASE)
+_COMMENT_RE = re.compile(r'<!--.*?-->', re.DOTALL)
+# 空标签按span、div、p的顺序逐个移除（内层移除后外层可能变为空标签，不能合并为一次匹配）
+_EMPTY_TAG_RES = (
+    re.compile(rf'<span[^>]*{_P}>\s*</span>'),
+    re.compile(rf'<div[^>]*{_P}>\s*</div>'),
+    re.compile(rf'<p[^>]*{_P}>\s*</p>'),
+)
+_DATA_ATTR_RE = re.compile(rf' data-[^=]*{_P}="[^"]*{_P}"')
+_WHITESPACE_RE = re.compile(r'\s+')
+_TAG_GAP_RE = re.compile(r'>\s+<')
+_NESTED_SPAN_RE = re.compile(rf'<span[^>]*{_P}><span([^>]*{_P})>(.*?)</span></span>')
+_BR_PARAGRAPH_RE = re.compile(rf'<p[^>]*{_P}>(\s*)<br[^>]*{_P}>(\s*)</p>')
+# 格式化HTML时切分标签和文本（依次尝试：闭合标签、注释、开始标签、文本、未闭合的标签）
+_FORMAT_TOKEN_RE = re.compile(
+    rf'(?P<close></[^>]*{_P}>)|(?P<comment><!--.*?-->)|(?P<open><(?!!--)[^>]*{_P}>)'
+    rf'|(?P<text>[^<]+{_P})|(?P<broken><)',
+    re.DOTALL
+)
+
+
+@lru_cache(maxsize=None)
+def _attr_pattern(attr_names):
+    """获取一次移除多个属性的正则表达式，按启用的属性组合缓存
+
+    参数:
+    - attr_names: 要移除的属性名元组，如("class", "style")
+    """
+    return re.compile(rf' (?:{"|".join(attr_names)})="[^"]*{_P}"')
+
+
+# 无需闭合的标签（不带属性时），格式化时不增加缩进
+_VOID_TAGS = frozenset(['<br', '<hr', '<img', '<input', '<link', '<meta'])
+
+
+def _format_html(html_content):
+    """格式化HTML：每个标签和文本单独成行，按嵌套层级缩进2个空格"""
+    indent = 0
+    lines = []
+    length = len(html_content)
+
+    # 由正则逐个切出标签和文本，扫描在C代码中完成
+    for match in _FORMAT_TOKEN_RE.finditer(html_content):
+        kind = match.lastgroup
+        token = match.group()
+        if kind == 'close':
+            # 闭合标签减少缩进
+            indent = max(0, indent - 2)
+            lines.append(' ' * indent + token)
+        elif kind == 'open':
+            # 检查是否为自闭合标签
+            is_self_closing = token[-2] == '/' or token[:-1].lower() in _VOID_TAGS
+
+            lines.append(' ' * indent + token)
+            if not is_self_closing:
+                indent += 2
+        elif kind == 'comment':
+            # 保留的注释单独成行，不影响缩进
+            lines.append(' ' * indent + token)
+        elif kind == 'text':
+            # 文本内容（位于末尾的文本原样保留）
+            if match.end() == length:
+                lines.append(' ' * indent + token)
+            else:
+                text_content = token.strip()
+                if text_content:
+                    lines.append(' ' * indent + text_content)
+        else:
+            # 未闭合的标签，忽略其后的内容
+            break
+
+    return '\n'.join(lines)
+
+
+# HTML优化选项的位标志
+OPT_REMOVE_HTML_HEAD = 1 << 0
+OPT_REMOVE_COMMENTS = 1 << 1
+OPT_REMOVE_EMPTY_TAGS = 1 << 2
+OPT_FORMAT_HTML = 1 << 3
+OPT_REMOVE_CLASS = 1 << 4
+OPT_REMOVE_ID = 1 << 5
+OPT_REMOVE_STYLE = 1 << 6
+OPT_REMOVE_DATA_ATTRS = 1 << 7
+OPT_REMOVE_WHITESPACE = 1 << 8
+OPT_MINIMIZE_TAGS = 1 << 9
+
+
+@lru_cache(maxsize=16)
+def _optimize_html(html_content, flags):
+    """按优化选项优化HTML代码，相同的HTML和选项直接返回缓存结果
+
+    参数:
+    - html_content: 原始HTML代码
+    - flags: OPT_*位标志的组合
+    """
+    if not html_content:
+        return ""
+
+    optimized_html = html_content
+
+    # 移除HTML、HEAD、META等标签及其内容
+    if flags & OPT_REMOVE_HTML_HEAD:
+        optimized_html = _HTML_HEAD_RE.sub('', optimized_html)
+        optimized_html = _HTML_TAIL_RE.sub('', optimized_html)
+
+    # 移除注释
+    if flags & OPT_REMOVE_COMMENTS:
+        optimized_html = _COMMENT_RE.sub('', optimized_html)
+
+    # 移除空的标签
+    if flags & OPT_REMOVE_EMPTY_TAGS:
+        for pattern in _EMPTY_TAG_RES:
+            optimized_html = pattern.sub('', optimized_html)
+
+    # 移除class、id、style属性（合并为一次扫描）
+    attr_names = tuple(name for name, flag in (("class", OPT_REMOVE_CLASS),
+                                               ("id", OPT_REMOVE_ID),
+                                               ("style", OPT_REMOVE_STYLE))
+                       if flags & flag)
+    if attr_names:
+        optimized_html = _attr_pattern(attr_names).sub('', optimized_html)
+
+    # 移除data-*属性
+    if flags & OPT_REMOVE_DATA_ATTRS:
+        optimized_html = _DATA_ATTR_RE.sub('', optimized_html)
+
+    # 移除不必要的空格和换行
+    if flags & OPT_REMOVE_WHITESPACE:
+        optimized_html = _WHITESPACE_RE.sub(' ', optimized_html)
+        optimized_html = _TAG_GAP_RE.sub('><', optimized_html)
+
+    # 最小化标签 (简化冗余标签)
+    if flags & OPT_MINIMIZE_TAGS:
+        # 移除多余的嵌套span
+        optimized_html = _NESTED_SPAN_RE.sub(r'<span\1>\2</span>', optimized_html)
+        # 移除单个换行符周围的额外p标签
+        optimized_html = _BR_PARAGRAPH_RE.sub(r'<br>', optimized_html)
+
+    # 格式化HTML
+    if flags & OPT_FORMAT_HTML:
+        optimized_html = _format_html(optimized_html)
+
+    return optimized_html
+
 
 class ClipboardHtmlViewer(QMainWindow):
     def __init__(self):
@@ -177,24 +333,22 @@ class ClipboardHtmlViewer(QMainWindow):
         vsplitter.setSizes([int(self.height() * 0.3), int(self.height() * 0.3), int(self.height() * 0.4)])
         self.vsplitter = vsplitter
 
+        # 上一次显示的优化结果对应的(HTML, 优化选项)
+        self._last_optimize_key = None
+
+        # 保存上一次的剪切板文本，用于检测变化
+        self.last_clipboard_text = ""
+        self.last_clipboard_html = ""
+
         # 获取剪切板实例
         self.clipboard = QApplication.clipboard()
 
-        # 监听剪切板变化
+        # 监听剪切板变化（某些应用不触发dataChanged信号，窗口激活时再检查一次，见changeEvent）
         self.clipboard.dataChanged.connect(self.onClipboardChange)
 
         # 初始化时立即获取剪切板内容
         self.onClipboardChange()
 
-        # 设置定时器，定期检查剪切板内容（防止某些应用不触发dataChanged信号）
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.checkClipboard)
-        self.timer.start(1000)  # 每秒检查一次
-
-        # 保存上一次的剪切板文本，用于检测变化
-        self.last_clipboard_text = ""
-        self.last_clipboard_html = ""
-
     def loadSettings(self):
         """从设置中加载窗口位置和大小"""
         geometry = self.settings.value("geometry")
@@ -243,12 +397,18 @@ class ClipboardHtmlViewer(QMainWindow):
         self.saveSettings()
         super().closeEvent(event)
 
+    def changeEvent(self, event):
+        """窗口重新激活时检查剪切板内容"""
+        if event.type() == QEvent.ActivationChange and self.isActiveWindow():
+            self.checkClipboard()
+        super().changeEvent(event)
+
     def onClipboardChange(self):
         """剪切板内容变化时的处理函数"""
         self.updateViews()
 
     def checkClipboard(self):
-        """定时检查剪切板内容"""
+        """检查剪切板内容是否变化"""
         clipboard_text = self.clipboard.text()
         clipboard_html = self.clipboard.mimeData().html()
 
@@ -256,106 +416,33 @@ class ClipboardHtmlViewer(QMainWindow):
         if clipboard_text != self.last_clipboard_text or clipboard_html != self.last_clipboard_html:
             self.updateViews()
 
-    def optimize_html(self, html_content):
-        """根据用户选择优化HTML代码"""
-        if not html_content:
-            return ""
-
-        optimized_html = html_content
-
-        # 移除HTML、HEAD、META等标签及其内容
-        if self.remove_html_head.isChecked():
-            optimized_html = re.sub(r'<html[^>]*>.*?<body[^>]*>', '', optimized_html, flags=re.DOTALL | re.IGNORECASE)
-            optimized_html = re.sub(r'</body>.*?</html>', '', optimized_html, flags=re.DOTALL | re.IGNORECASE)
-
-        # 移除注释
-        if self.remove_comments.isChecked():
-            optimized_html = re.sub(r'<!--.*?-->', '', optimized_html, flags=re.DOTALL)
-
-        # 移除空的标签
-        if self.remove_empty_tags.isChecked():
-            optimized_html = re.sub(r'<span[^>]*>\s*</span>', '', optimized_html)
-            optimized_html = re.sub(r'<div[^>]*>\s*</div>', '', optimized_html)
-            optimized_html = re.sub(r'<p[^>]*>\s*</p>', '', optimized_html)
-
-        # 移除class属性
-        if self.remove_class.isChecked():
-            optimized_html = re.sub(r' class="[^"]*"', '', optimized_html)
-
-        # 移除id属性
-        if self.remove_id.isChecked():
-            optimized_html = re.sub(r' id="[^"]*"', '', optimized_html)
-
-        # 移除style属性
-        if self.remove_style.isChecked():
-            optimized_html = re.sub(r' style="[^"]*"', '', optimized_html)
-
-        # 移除data-*属性
-        if self.remove_data_attrs.isChecked():
-            optimized_html = re.sub(r' data-[^=]*="[^"]*"', '', optimized_html)
-
-        # 移除不必要的空格和换行
-        if self.remove_whitespace.isChecked():
-            optimized_html = re.sub(r'\s+', ' ', optimized_html)
-            optimized_html = re.sub(r'>\s+<', '><', optimized_html)
-
-        # 最小化标签 (简化冗余标签)
-        if self.minimize_tags.isChecked():
-            # 移除多余的嵌套span
-            optimized_html = re.sub(r'<span[^>]*><span([^>]*)>(.*?)</span></span>', r'<span\1>\2</span>', optimized_html)
-            # 移除单个换行符周围的额外p标签
-            optimized_html = re.sub(r'<p[^>]*>(\s*)<br[^>]*>(\s*)</p>', r'<br>', optimized_html)
-
-        # 格式化HTML
-        if self.format_html.isChecked():
-            formatted_html = ""
-            indent = 0
-            lines = []
-
-            i = 0
-            while i < len(optimized_html):
-                if optimized_html[i:i + 2] == '</':
-                    # 闭合标签减少缩进
-                    indent = max(0, indent - 2)
-                    j = optimized_html.find('>', i)
-                    if j == -1:
-                        break
-                    lines.append(' ' * indent + optimized_html[i:j + 1])
-                    i = j + 1
-                elif optimized_html[i] == '<' and optimized_html[i:i + 4] != '<!--' and optimized_html[i:i + 2] != '</':
-                    # 开始标签
-                    j = optimized_html.find('>', i)
-                    if j == -1:
-                        break
-
-                    # 检查是否为自闭合标签
-                    is_self_closing = optimized_html[j - 1] == '/' or optimized_html[i:j].lower() in ['<br', '<hr', '<img', '<input', '<link', '<meta']
-
-                    lines.append(' ' * indent + optimized_html[i:j + 1])
-                    if not is_self_closing:
-                        indent += 2
-                    i = j + 1
-                else:
-                    # 文本内容
-                    j = optimized_html.find('<', i)
-                    if j == -1:
-                        lines.append(' ' * indent + optimized_html[i:])
-                        break
-
-                    if j > i:
-                        text_content = optimized_html[i:j].strip()
-                        if text_content:
-                            lines.append(' ' * indent + text_content)
-                    i = j
-
-            optimized_html = '\n'.join(lines)
-
-        return optimized_html
+    def optimization_flags(self):
+        """将当前勾选的优化选项编码为位掩码"""
+        flags = 0
+        for flag, checkbox in ((OPT_REMOVE_HTML_HEAD, self.remove_html_head),
+                               (OPT_REMOVE_COMMENTS, self.remove_comments),
+                               (OPT_REMOVE_EMPTY_TAGS, self.remove_empty_tags),
+                               (OPT_FORMAT_HTML, self.format_html),
+                               (OPT_REMOVE_CLASS, self.remove_class),
+                               (OPT_REMOVE_ID, self.remove_id),
+                               (OPT_REMOVE_STYLE, self.remove_style),
+                               (OPT_REMOVE_DATA_ATTRS, self.remove_data_attrs),
+                               (OPT_REMOVE_WHITESPACE, self.remove_whitespace),
+                               (OPT_MINIMIZE_TAGS, self.minimize_tags)):
+            if checkbox.isChecked():
+                flags |= flag
+        return flags
 
     def updateOptimizedView(self):
         """更新优化后的HTML视图"""
-        if self.html_view.toPlainText():
-            optimized_html = self.optimize_html(self.html_view.toPlainText())
+        html_content = self.html_view.toPlainText()
+        if html_content:
+            # HTML和优化选项都未变化时，优化结果已在视图中，无需重新设置
+            key = (html_content, self.optimization_flags())
+            if key == self._last_optimize_key:
+                return
+            self._last_optimize_key = key
+            optimized_html = _optimize_html(*key)
             self.optimized_html_view.setPlainText(optimized_html)
 
     def updateViews(self):
@@ -368,7 +455,7 @@ class ClipboardHtmlViewer(QMainWindow):
 
         # 更新左侧富文本视图
         if mime_data.hasHtml():
-            self.clipboard_view.setHtml(mime_data.html())
+            self.clipboard_view.setHtml(self.last_clipboard_html)
         elif mime_data.hasText():
             self.clipboard_view.setPlainText(mime_data.text())
         else:
@@ -376,14 +463,14 @@ class ClipboardHtmlViewer(QMainWindow):
 
         # 更新右上侧原始HTML代码视图
         if mime_data.hasHtml():
-            html_content = mime_data.html()
-            self.html_view.setPlainText(html_content)
+            self.html_view.setPlainText(self.last_clipboard_html)
 
             # 更新右下侧优化后的HTML代码视图
             self.updateOptimizedView()
         else:
             self.html_view.setPlainText("剪切板中没有HTML内容")
             self.optimized_html_view.setPlainText("无HTML内容可优化")
+            self._last_optimize_key = None
 
 
 def main():